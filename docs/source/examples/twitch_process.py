@@ -5,10 +5,9 @@ SEED = 1337
 
 # Data obtained from
 # https://www.kaggle.com/datasets/aayushmishra1512/twitchdata
-df = pd.read_csv("twitchdata.csv")
-df.columns = df.columns.str.lower()
-df.columns = df.columns.str.replace(" ", "_")
-df.columns = df.columns.str.replace("(minutes)", "", regex=False)
+df = pd.read_csv("twitchdata.csv").rename(
+    columns=lambda column: column.lower().replace(" ", "_").replace("(minutes)", "")
+)
 
 increasing_columns = [
     "watch_time",
@@ -22,26 +21,42 @@ fluctuating_columns = [
     "peak_viewers",
 ]
 
-df_v1 = df.copy()
-df_v2 = df.copy()
+# Apart from watch_time, all counts fit into 32 bit integers.
+df = df.astype(
+    {
+        column: np.int32
+        for column in increasing_columns + fluctuating_columns
+        if column != "watch_time"
+    }
+)
 
 # Make numeric columns of new version change from old version.
+# Draw the relative changes of all columns at once; increasing columns only grow.
 rng = np.random.default_rng(SEED)
-for increasing_column in increasing_columns:
-    growth = np.abs(rng.normal(0, 0.15, size=df_v1.shape[0]))
-    new_values = (1 + growth) * df_v1[increasing_column]
-    df_v2[increasing_column] = new_values.astype(int)
-
-for fluctuating_column in fluctuating_columns:
-    change = rng.normal(0, 0.15, size=df_v1.shape[0])
-    df_v2[fluctuating_column] = ((1 + change) * df_v1[fluctuating_column]).astype(int)
+changing_columns = increasing_columns + fluctuating_columns
+change = rng.normal(0, 0.15, size=(len(changing_columns), df.shape[0]))
+change[: len(increasing_columns)] = np.abs(change[: len(increasing_columns)])
+new_values = (1 + change.T) * df[changing_columns].to_numpy(dtype=float)
+df_v2 = df.assign(
+    **pd.DataFrame(new_values, index=df.index, columns=changing_columns).astype(
+        df[changing_columns].dtypes
+    )
+)
 
 # Make old version not have data about all channels from current version.
-df_v1 = df_v1.sample(frac=0.85, random_state=SEED)
+df_v1 = df.sample(frac=0.85, random_state=SEED)
 
 # Introduce a data error.
-index = (~df_v2["channel"].isin(df_v1["channel"])).idxmax()
+# Stop at the first channel of the new version missing from the old version.
+channels_v1 = frozenset(df_v1["channel"])
+index = next(
+    index
+    for index, channel in zip(df_v2.index, df_v2["channel"])
+    if channel not in channels_v1
+)
 df_v2.loc[index, "language"] = "Sw3d1zh"
 
-df_v1.to_csv("twitch_version1.csv")
-df_v2.to_csv("twitch_version2.csv")
+# Compress the files; a fixed mtime keeps the output reproducible.
+compression = {"method": "gzip", "mtime": 0}
+df_v1.to_csv("twitch_version1.csv.gz", compression=compression)
+df_v2.to_csv("twitch_version2.csv.gz", compression=compression)
@@ -6,12 +6,16 @@ import sqlalchemy as sa
 from datajudge import BetweenRequirement, Condition, WithinRequirement
 from datajudge.pytest_integration import collect_data_tests
 
+# Number of constraints tested concurrently.
+MAX_WORKERS = 4
+
 
 @pytest.fixture(scope="module")
 def datajudge_engine():
     address = os.environ.get("DB_ADDR", "localhost")
     connection_string = f"postgresql://datajudge:datajudge@{address}:5432/datajudge"
-    return sa.create_engine(connection_string)
+    # Allow for one connection per worker of ``collect_data_tests``.
+    return sa.create_engine(connection_string, pool_size=MAX_WORKERS, max_overflow=0)
 
 
 # Postgres' default database.
@@ -93,4 +97,4 @@ requirements = [
     between_requirement_version,
     between_requirement_columns,
 ]
-test_func = collect_data_tests(requirements)
+test_func = collect_data_tests(requirements, max_workers=MAX_WORKERS)
@@ -1,15 +1,33 @@
+import csv
+import io
 import os
 
 import pandas as pd
 import sqlalchemy as sa
 
-df_v1 = pd.read_csv("twitch_version1.csv")
-df_v2 = pd.read_csv("twitch_version2.csv")
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """Insert rows via Postgres' ``COPY FROM STDIN`` instead of one INSERT per row."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+    columns = ", ".join(f'"{key}"' for key in keys)
+    table_name = f"{table.schema}.{table.name}" if table.schema else table.name
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer)
+
+
+df_v1 = pd.read_csv("twitch_version1.csv.gz")
+df_v2 = pd.read_csv("twitch_version2.csv.gz")
 
 # Upload tables to local Postgres instance.
 # Run ``$ ./start_postgres.sh`` to make sure it is up and running.
 address = os.environ.get("DB_ADDR", "localhost")
 connection_string = f"postgresql://datajudge:datajudge@{address}:5432/datajudge"
 engine = sa.create_engine(connection_string)
-df_v2.to_sql("twitch_v2", engine, schema="public", if_exists="replace")
-df_v1.to_sql("twitch_v1", engine, schema="public", if_exists="replace")
+df_v2.to_sql(
+    "twitch_v2", engine, schema="public", if_exists="replace", method=psql_insert_copy
+)
+df_v1.to_sql(
+    "twitch_v1", engine, schema="public", if_exists="replace", method=psql_insert_copy
+)
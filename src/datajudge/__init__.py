@@ -1,9 +1,13 @@
 """datajudge allows to assess  whether data from database complies with reference
 information."""
 
-from .constraints.base import Constraint
-from .db_access import Condition
-from .requirements import BetweenRequirement, Requirement, WithinRequirement
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .constraints.base import Constraint
+    from .db_access import Condition
+    from .requirements import BetweenRequirement, Requirement, WithinRequirement
 
 __all__ = [
     "BetweenRequirement",
@@ -14,3 +18,31 @@ __all__ = [
 ]
 
 __version__ = "1.9.2"
+
+# The public objects are imported on first access only, s.t. a plain
+# ``import datajudge`` does not pay for importing sqlalchemy.
+_LAZY_IMPORTS = {
+    "BetweenRequirement": ".requirements",
+    "Condition": ".db_access",
+    "Constraint": ".constraints.base",
+    "Requirement": ".requirements",
+    "WithinRequirement": ".requirements",
+}
+# Submodules which used to be available as attributes after ``import datajudge``.
+_SUBMODULES = {"constraints", "db_access", "formatter", "requirements", "utils"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
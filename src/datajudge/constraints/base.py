@@ -1,11 +1,24 @@
 import abc
+import threading
+import weakref
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Any, Callable, Collection, List, Optional, Tuple, TypeVar, Union
+from functools import cached_property, partial, wraps
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import sqlalchemy as sa
 
-from ..db_access import DataReference
+from .. import db_access
+from ..db_access import _SLOTS, DataReference
 from ..formatter import Formatter
 from ..utils import OutputProcessor, output_processor_limit
 
@@ -16,23 +29,67 @@ OptionalSelections = Optional[List[sa.sql.expression.Select]]
 ToleranceGetter = Callable[[sa.engine.Engine], float]
 
 
+# Compiled queries per selection and dialect. Selections are kept by the constraints
+# which created them, s.t. testing a constraint again doesn't render them again.
+_compiled_queries: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, Any], str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_compiled_queries_lock = threading.Lock()
+
+
+def compile_literal(
+    engine: sa.engine.Engine, selection: sa.sql.expression.Select
+) -> str:
+    """Render a selection as a query string with literal values for an engine."""
+    # Engines of the same backend and server version render queries alike.
+    dialect = engine.dialect
+    dialect_key = (dialect.name, getattr(dialect, "server_version_info", None))
+    with _compiled_queries_lock:
+        queries = _compiled_queries.setdefault(selection, {})
+        if dialect_key in queries:
+            return queries[dialect_key]
+    query = str(
+        selection.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+    with _compiled_queries_lock:
+        queries[dialect_key] = query
+    return query
+
+
 def uncommon_substrings(string1: str, string2: str) -> Tuple[str, str]:
+    """Strip the qualifiers which both dot-separated names have in common."""
     qualifiers1 = string1.split(".")
     qualifiers2 = string2.split(".")
-    if qualifiers1[0] != qualifiers2[0]:
+    n_common = 0
+    for qualifier1, qualifier2 in zip(qualifiers1[:-1], qualifiers2[:-1]):
+        if qualifier1 != qualifier2:
+            break
+        n_common += 1
+    if n_common == 0:
         return string1, string2
-    if qualifiers1[1] != qualifiers2[0]:
-        return ".".join(qualifiers1[1:]), ".".join(qualifiers2[1:])
-    return qualifiers1[-1], qualifiers2[-1]
+    return ".".join(qualifiers1[n_common:]), ".".join(qualifiers2[n_common:])
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TestResult:
     outcome: bool
     _failure_message: Optional[str] = field(default=None, repr=False)
     _constraint_description: Optional[str] = field(default=None, repr=False)
-    _factual_queries: Optional[str] = field(default=None, repr=False)
-    _target_queries: Optional[str] = field(default=None, repr=False)
+    _factual_queries: Optional[List[str]] = field(default=None, repr=False)
+    _target_queries: Optional[List[str]] = field(default=None, repr=False)
+    # Alternatively to queries, selections can be given. These are only rendered as
+    # queries once needed, e.g. for the logging message.
+    _engine: Optional[sa.engine.Engine] = field(default=None, repr=False, compare=False)
+    _factual_selections: OptionalSelections = field(
+        default=None, repr=False, compare=False
+    )
+    _target_selections: OptionalSelections = field(
+        default=None, repr=False, compare=False
+    )
+    # Test results are immutable, hence their logging message is only built once.
+    _logging_message: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def formatted_failure_message(self, formatter: Formatter) -> Optional[str]:
         return (
@@ -54,37 +111,44 @@ class TestResult:
     def constraint_description(self) -> Optional[str]:
         return self.formatted_constraint_description(DEFAULT_FORMATTER)
 
+    def _get_queries(
+        self, queries: Optional[List[str]], selections: OptionalSelections
+    ) -> Optional[List[str]]:
+        if queries is not None or not selections or self._engine is None:
+            return queries
+        return list(map(partial(compile_literal, self._engine), selections))
+
     @property
-    def logging_message(self):
-        constraint_description_message = (
-            f"/*\n\t{self.constraint_description}\n*/"
-            if self.constraint_description
-            else ""
-        )
-        failure_message = (
-            f"\n\n/*\nFailure message:\n{self.failure_message}\n*/"
-            if self.failure_message
-            else ""
-        )
-        factual_query_message = ""
-        if self._factual_queries is not None:
-            factual_query_message = "\n\n --Factual queries: \n " + "\n".join(
-                self._factual_queries
-            )
+    def factual_queries(self) -> Optional[List[str]]:
+        return self._get_queries(self._factual_queries, self._factual_selections)
 
-        target_query_message = ""
-        if self._target_queries is not None:
-            target_query_message = "\n\n-- Target queries: \n " + "\n".join(
-                self._target_queries
-            )
+    @property
+    def target_queries(self) -> Optional[List[str]]:
+        return self._get_queries(self._target_queries, self._target_selections)
 
-        return (
-            constraint_description_message
-            + failure_message
-            + factual_query_message
-            + target_query_message
-            + "\n --- \n"
-        )
+    @property
+    def logging_message(self):
+        if self._logging_message is None:
+            object.__setattr__(self, "_logging_message", self._build_logging_message())
+        return self._logging_message
+
+    def _build_logging_message(self) -> str:
+        # Format the description and the failure message only once each.
+        constraint_description = self.constraint_description
+        failure_message = self.failure_message
+        parts = []
+        if constraint_description:
+            parts.append(f"/*\n\t{constraint_description}\n*/")
+        if failure_message:
+            parts.append(f"\n\n/*\nFailure message:\n{failure_message}\n*/")
+        if (factual_queries := self.factual_queries) is not None:
+            factual_query_string = "\n".join(factual_queries)
+            parts.append(f"\n\n --Factual queries: \n {factual_query_string}")
+        if (target_queries := self.target_queries) is not None:
+            target_query_string = "\n".join(target_queries)
+            parts.append(f"\n\n-- Target queries: \n {target_query_string}")
+        parts.append("\n --- \n")
+        return "".join(parts)
 
     @classmethod
     def success(cls):
@@ -95,6 +159,40 @@ class TestResult:
         return cls(False, *args, **kwargs)
 
 
+def cache_per_engine(
+    cache_name: str,
+) -> Callable[
+    [Callable[[Any, sa.engine.Engine], T]], Callable[[Any, sa.engine.Engine], T]
+]:
+    """Cache the values returned by a method of a constraint per engine.
+
+    The values are stored in the constraint's dictionary attribute ``cache_name``,
+    limited by its ``cache_size``. Overrides of ``get_factual_value`` and
+    ``get_target_value`` are decorated automatically, see ``Constraint``.
+    """
+
+    def decorator(
+        method: Callable[[Any, sa.engine.Engine], T],
+    ) -> Callable[[Any, sa.engine.Engine], T]:
+        @wraps(method)
+        def cached_method(self, engine: sa.engine.Engine) -> T:
+            cache = getattr(self, cache_name)
+            if engine in cache:
+                if self.cache_size is not None:
+                    # Mark the engine as most recently used s.t. the least recently
+                    # used one is evicted first, as with ``functools.lru_cache``.
+                    cache[engine] = cache.pop(engine)
+                return cache[engine]
+            value = method(self, engine)
+            self._cache_value(cache, engine, value)
+            return value
+
+        cached_method._cache_name = cache_name  # type: ignore[attr-defined]
+        return cached_method
+
+    return decorator
+
+
 class Constraint(abc.ABC):
     """Express a DataReference constraint against either another DataReference or a reference value.
 
@@ -112,8 +210,9 @@ class Constraint(abc.ABC):
     be it the DataReference of primary interest, `ref`, or a baseline DataReference, `ref2`, to
     value. If `ref_value` is already provided, usually no further mapping needs to be taken care of.
 
-    By default, retrieved arguments are cached indefinitely ``@lru_cache(maxsize=None)``.
-    This can be controlled by setting the `cache_size` argument to a different value.
+    By default, retrieved values are cached indefinitely per engine.
+    This can be controlled by setting the `cache_size` argument to a different value,
+    limiting the number of engines for which values are cached.
     ``0`` disables caching.
     """
 
@@ -129,7 +228,17 @@ class Constraint(abc.ABC):
         ] = output_processor_limit,
         cache_size=None,
     ):
-        self._check_if_valid_between_or_within(ref2, ref_value)
+        # Exactly one of ref2 and ref_value needs to be given.
+        if ref2 is not None and ref_value is not None:
+            raise ValueError(
+                "Both table 2 ref and constant given to "
+                f"{type(self).__name__}. Use either of them, not both."
+            )
+        if ref2 is None and ref_value is None:
+            raise ValueError(
+                "Neither table 2 ref nor constant given to "
+                f"{type(self).__name__}. Use exactly either of them."
+            )
         self.ref = ref
         self.ref2 = ref2
         self.ref_value = ref_value
@@ -146,38 +255,38 @@ class Constraint(abc.ABC):
         self.output_processors = output_processors
 
         self.cache_size = cache_size
-        self._setup_caching()
-
-    def _setup_caching(self):
-        # this has an added benefit of allowing the class to be garbage collected
-        # according to https://rednafi.com/python/lru_cache_on_methods/
-        # and https://docs.astral.sh/ruff/rules/cached-instance-method/
-        self.get_factual_value = lru_cache(self.cache_size)(self.get_factual_value)  # type: ignore[method-assign]
-        self.get_target_value = lru_cache(self.cache_size)(self.get_target_value)  # type: ignore[method-assign]
-
-    def _check_if_valid_between_or_within(
-        self, ref2: Optional[DataReference], ref_value: Optional[Any]
-    ):
-        """Check whether exactly one of ref2 and ref_value arguments have been used."""
-        class_name = self.__class__.__name__
-        if ref2 is not None and ref_value is not None:
-            raise ValueError(
-                "Both table 2 ref and constant given to "
-                f"{class_name}. Use either of them, not both."
-            )
-        if ref2 is None and ref_value is None:
-            raise ValueError(
-                "Neither table 2 ref nor constant given to "
-                f"{class_name}. Use exactly either of them."
-            )
-
-    # @lru_cache(maxsize=None), see _setup_caching()
+        self._factual_values: Dict[sa.engine.Engine, Any] = {}
+        self._target_values: Dict[sa.engine.Engine, Any] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Cache the values of overriding getters as well, e.g. of custom constraints.
+        for method_name, cache_name in [
+            ("get_factual_value", "_factual_values"),
+            ("get_target_value", "_target_values"),
+        ]:
+            method = cls.__dict__.get(method_name)
+            if callable(method) and not hasattr(method, "_cache_name"):
+                setattr(cls, method_name, cache_per_engine(cache_name)(method))
+
+    def _cache_value(
+        self, cache: Dict[sa.engine.Engine, Any], engine: sa.engine.Engine, value: Any
+    ) -> None:
+        # A constraint is usually only tested against one or two engines, for which
+        # a plain dictionary is a lot cheaper than a ``functools.lru_cache`` per method.
+        if self.cache_size == 0:
+            return
+        if self.cache_size is not None and len(cache) >= self.cache_size:
+            del cache[next(iter(cache))]
+        cache[engine] = value
+
+    @cache_per_engine("_factual_values")
     def get_factual_value(self, engine: sa.engine.Engine) -> Any:
         factual_value, factual_selections = self.retrieve(engine, self.ref)
         self.factual_selections = factual_selections
         return factual_value
 
-    # @lru_cache(maxsize=None), see _setup_caching()
+    @cache_per_engine("_target_values")
     def get_target_value(self, engine: sa.engine.Engine) -> Any:
         if self.ref2 is None:
             return self.ref_value
@@ -188,6 +297,10 @@ class Constraint(abc.ABC):
     def get_description(self) -> str:
         if self.name is not None:
             return self.name
+        return self._description
+
+    @cached_property
+    def _description(self) -> str:
         if self.ref2 is None:
             data_source_string = str(self.ref.data_source)
         else:
@@ -200,30 +313,31 @@ class Constraint(abc.ABC):
             data_source_string = f"{data_source1_substring} | {data_source2_substring}"
         return self.__class__.__name__ + "::" + data_source_string
 
-    @property
+    @cached_property
     def target_prefix(self) -> str:
         return f"{self.ref2}'s " if (self.ref2 is not None) else ""
 
-    @property
+    @cached_property
     def condition_string(self) -> str:
-        if self.ref.condition is None and (
-            self.ref2 is None or self.ref2.condition is None
-        ):
-            return ""
-        ref1_clause = self.ref.get_clause_string()
+        # Only render the clauses which end up in the string.
+        condition1 = self.ref.condition
         if self.ref2 is None:
             # within constraint
-            return f"Condition: {ref1_clause}"
-        ref2_clause = self.ref2.get_clause_string()
-        if self.ref.condition == self.ref2.condition:
-            return f"Condition on both tables: {ref1_clause}; "
-        if self.ref.condition is None:
-            return f"Condition on second table: {ref2_clause}; "
-        if self.ref2.condition is None:
-            return f"Condition on first table: {ref1_clause}; "
+            if condition1 is None:
+                return ""
+            return f"Condition: {self.ref.get_clause_string()}"
+        condition2 = self.ref2.condition
+        if condition1 is None and condition2 is None:
+            return ""
+        if condition1 == condition2:
+            return f"Condition on both tables: {self.ref.get_clause_string()}; "
+        if condition1 is None:
+            return f"Condition on second table: {self.ref2.get_clause_string()}; "
+        if condition2 is None:
+            return f"Condition on first table: {self.ref.get_clause_string()}; "
         return (
-            f"Condition on first table: {ref1_clause}. "
-            f"Condition on second table: {ref2_clause}. "
+            f"Condition on first table: {self.ref.get_clause_string()}. "
+            f"Condition on second table: {self.ref2.get_clause_string()}. "
         )
 
     def retrieve(
@@ -237,38 +351,23 @@ class Constraint(abc.ABC):
     ) -> Tuple[bool, Optional[str]]:
         pass
 
+    def get_values(self, engine: sa.engine.Engine) -> Tuple[Any, Any]:
+        """Retrieve the factual and the target value."""
+        with db_access.shared_connection(engine):
+            return self.get_factual_value(engine), self.get_target_value(engine)
+
     def test(self, engine: sa.engine.Engine) -> TestResult:
-        value_factual = self.get_factual_value(engine)
-        value_target = self.get_target_value(engine)
+        value_factual, value_target = self.get_values(engine)
         is_success, assertion_message = self.compare(value_factual, value_target)
         if is_success:
             return TestResult.success()
 
-        factual_queries = None
-        if self.factual_selections:
-            factual_queries = [
-                str(
-                    factual_selection.compile(
-                        engine, compile_kwargs={"literal_binds": True}
-                    )
-                )
-                for factual_selection in self.factual_selections
-            ]
-        target_queries = None
-        if self.target_selections:
-            target_queries = [
-                str(
-                    target_selection.compile(
-                        engine, compile_kwargs={"literal_binds": True}
-                    )
-                )
-                for target_selection in self.target_selections
-            ]
         return TestResult.failure(
             assertion_message,
             self.get_description(),
-            factual_queries,
-            target_queries,
+            _engine=engine,
+            _factual_selections=self.factual_selections,
+            _target_selections=self.target_selections,
         )
 
     def apply_output_formatting(self, values: Collection) -> Collection:
@@ -282,7 +381,6 @@ def format_sample(sample, ref: DataReference) -> str:
     """Build a string from a database row indicating its column values."""
     if ref.columns is None:
         return str(sample)
-    sample_string = " , ".join(
-        map(lambda x: f"{x[0]} = {x[1]}", zip(ref.columns, list(sample)))
+    return " , ".join(
+        f"{column} = {value}" for column, value in zip(ref.columns, sample)
     )
-    return sample_string
@@ -7,6 +7,14 @@ from .. import db_access
 from ..db_access import DataReference, is_snowflake, lowercase_column_names
 from .base import Constraint, OptionalSelections
 
+# Backend-specific spellings of column types which are compared as another type.
+_TYPE_ALIASES = {
+    # Integer columns loaded from snowflake database may be referred to as decimal with
+    # 0 scale. More here:
+    # https://docs.snowflake.com/en/sql-reference/data-types-numeric.html#decimal-numeric
+    "decimal(38, 0)": "integer",
+}
+
 
 class Column(Constraint, abc.ABC):
     def retrieve(
@@ -32,43 +40,49 @@ class ColumnExistence(Column):
 
     def compare(
         self, column_names_factual: List[str], column_names_target: List[str]
-    ) -> Tuple[bool, str]:
-        excluded_columns = list(
-            filter(lambda c: c not in column_names_factual, column_names_target)
-        )
+    ) -> Tuple[bool, Optional[str]]:
+        column_names_factual_set = set(column_names_factual)
+        excluded_columns = [
+            c for c in column_names_target if c not in column_names_factual_set
+        ]
+        if not excluded_columns:
+            return True, None
         assertion_message = (
             f"{self.ref} doesn't have column(s) " f"{', '.join(excluded_columns)}."
         )
-        result = len(excluded_columns) == 0
-        return result, assertion_message
+        return False, assertion_message
 
 
 class ColumnSubset(Column):
     def compare(
         self, column_names_factual: List[str], column_names_target: List[str]
-    ) -> Tuple[bool, str]:
-        missing_columns = list(
-            filter(lambda c: c not in column_names_target, column_names_factual)
-        )
+    ) -> Tuple[bool, Optional[str]]:
+        column_names_target_set = set(column_names_target)
+        missing_columns = [
+            c for c in column_names_factual if c not in column_names_target_set
+        ]
+        if not missing_columns:
+            return True, None
         assertion_message = (
             f"{self.ref2} doesn't have column(s) " f"{', '.join(missing_columns)}. "
         )
-        result = len(missing_columns) == 0
-        return result, assertion_message
+        return False, assertion_message
 
 
 class ColumnSuperset(Column):
     def compare(
         self, column_names_factual: List[str], column_names_target: List[str]
-    ) -> Tuple[bool, str]:
-        missing_columns = list(
-            filter(lambda c: c not in column_names_factual, column_names_target)
-        )
+    ) -> Tuple[bool, Optional[str]]:
+        column_names_factual_set = set(column_names_factual)
+        missing_columns = [
+            c for c in column_names_target if c not in column_names_factual_set
+        ]
+        if not missing_columns:
+            return True, None
         assertion_message = (
             f"{self.ref} doesn't have column(s) " f"{', '.join(missing_columns)}."
         )
-        result = len(missing_columns) == 0
-        return result, assertion_message
+        return False, assertion_message
 
 
 class ColumnType(Constraint):
@@ -100,6 +114,9 @@ class ColumnType(Constraint):
             cache_size=cache_size,
         )
         self.column_type = column_type
+        self._target_lower = (
+            column_type.lower() if isinstance(column_type, str) else None
+        )
 
     def retrieve(
         self, engine: sa.engine.Engine, ref: DataReference
@@ -116,10 +133,11 @@ class ColumnType(Constraint):
             result = isinstance(column_type_factual, type(column_type_target))
         else:
             column_type = str(column_type_factual).lower()
-            # Integer columns loaded from snowflake database may be referred to as decimal with
-            # 0 scale. More here:
-            # https://docs.snowflake.com/en/sql-reference/data-types-numeric.html#decimal-numeric
-            if column_type == "decimal(38, 0)":
-                column_type = "integer"
-            result = column_type.startswith(column_type_target.lower())
+            column_type = _TYPE_ALIASES.get(column_type, column_type)
+            if self.ref2 is None and self._target_lower is not None:
+                # Without ``ref2``, the target is always ``column_type``.
+                target_lower = self._target_lower
+            else:
+                target_lower = column_type_target.lower()
+            result = column_type.startswith(target_lower)
         return result, assertion_message
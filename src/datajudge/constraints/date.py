@@ -1,11 +1,11 @@
 import datetime as dt
-from typing import Any, Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Tuple, Union
 
 import sqlalchemy as sa
 
 from .. import db_access
 from ..db_access import DataReference
-from .base import Constraint, OptionalSelections, TestResult
+from .base import Constraint, OptionalSelections
 from .interval import NoGapConstraint, NoOverlapConstraint
 
 INPUT_DATE_FORMAT = "'%Y-%m-%d'"
@@ -13,12 +13,36 @@ INPUT_DATE_FORMAT = "'%Y-%m-%d'"
 Date = Union[str, dt.date, dt.datetime]
 
 
+_FORMATS_BY_COLUMN_TYPE = {
+    "date": "%Y-%m-%d",
+    "datetime": "%Y-%m-%d %H:%M:%S",
+    "datetime2": "%Y-%m-%d %H:%M:%S",
+    "smalldatetime": "%Y-%m-%d %H:%M:%S",
+}
+
+
+def parse_input_date(value: str) -> dt.date:
+    """Parse a date given in ``INPUT_DATE_FORMAT``, e.g. ``"'2021-01-31'"``."""
+    try:
+        return dt.date.fromisoformat(value.strip("'"))
+    except ValueError:
+        # ``strptime`` additionally accepts months and days without leading zeros.
+        return dt.datetime.strptime(value, INPUT_DATE_FORMAT).date()
+
+
 def get_format_from_column_type(column_type: str) -> str:
-    if column_type.lower() == "date":
-        return "%Y-%m-%d"
-    if column_type.lower() in ["datetime", "datetime2", "smalldatetime"]:
-        return "%Y-%m-%d %H:%M:%S"
-    raise ValueError(f"Illegal date column type: {column_type}")
+    try:
+        return _FORMATS_BY_COLUMN_TYPE[column_type.lower()]
+    except KeyError:
+        raise ValueError(f"Illegal date column type: {column_type}") from None
+
+
+# The ISO parsers are a lot faster than ``dt.datetime.strptime`` for the formats
+# which coincide with ISO 8601.
+_DATE_PARSERS: Dict[str, Callable[[str], dt.date]] = {
+    "%Y-%m-%d": dt.date.fromisoformat,
+    "%Y-%m-%d %H:%M:%S": lambda value: dt.datetime.fromisoformat(value).date(),
+}
 
 
 def convert_to_date(db_result: Date, format: str) -> dt.date:
@@ -27,8 +51,15 @@ def convert_to_date(db_result: Date, format: str) -> dt.date:
     if isinstance(db_result, dt.date):
         return db_result
     if isinstance(db_result, str):
-        # Get rid of nanoseconds as they cannot be parsed by strptime.
-        return dt.datetime.strptime(db_result.split(".")[0], format).date()
+        # Get rid of nanoseconds as they cannot be parsed.
+        value = db_result.partition(".")[0]
+        if (parser := _DATE_PARSERS.get(format)) is not None:
+            try:
+                return parser(value)
+            except ValueError:
+                # ``strptime`` additionally accepts fields without leading zeros.
+                pass
+        return dt.datetime.strptime(value, format).date()
     raise TypeError(f"Value hast type {type(db_result)} cannot be converted to date.")
 
 
@@ -48,7 +79,7 @@ class DateMin(Constraint):
         self.use_lower_bound_reference = use_lower_bound_reference
         min_date: Optional[dt.date] = None
         if min_value is not None:
-            min_date = dt.datetime.strptime(min_value, INPUT_DATE_FORMAT).date()
+            min_date = parse_input_date(min_value)
         super().__init__(
             ref,
             ref2=ref2,
@@ -63,26 +94,27 @@ class DateMin(Constraint):
         result, selections = db_access.get_min(engine, ref)
         return convert_to_date(result, self.format), selections
 
-    def compare(self, min_factual: dt.date, min_target: dt.date) -> Tuple[bool, str]:
+    def compare(
+        self, min_factual: dt.date, min_target: dt.date
+    ) -> Tuple[bool, Optional[str]]:
         if min_target is None:
-            return TestResult(True, "")
+            return True, None
         if min_factual is None:
-            return TestResult(min_target == 0, "Empty set.")
+            return min_target == 0, "Empty set."
         if self.use_lower_bound_reference:
-            assertion_text = (
-                f"{self.ref} has min {min_factual} < "
-                f"{self.target_prefix} {min_target}. "
-                f"{self.condition_string}"
-            )
             result = min_factual >= min_target
+            relation = "<"
         else:
-            assertion_text = (
-                f"{self.ref} has min {min_factual} > "
-                f"{self.target_prefix} {min_target}. "
-                f"{self.condition_string}"
-            )
             result = min_factual <= min_target
-        return result, assertion_text
+            relation = ">"
+        if result:
+            return True, None
+        assertion_text = (
+            f"{self.ref} has min {min_factual} {relation} "
+            f"{self.target_prefix} {min_target}. "
+            f"{self.condition_string}"
+        )
+        return False, assertion_text
 
 
 class DateMax(Constraint):
@@ -101,7 +133,7 @@ class DateMax(Constraint):
         self.use_upper_bound_reference = use_upper_bound_reference
         max_date: Optional[dt.date] = None
         if max_value is not None:
-            max_date = dt.datetime.strptime(max_value, INPUT_DATE_FORMAT).date()
+            max_date = parse_input_date(max_value)
         super().__init__(
             ref,
             ref2=ref2,
@@ -116,27 +148,27 @@ class DateMax(Constraint):
         value, selections = db_access.get_max(engine, ref)
         return convert_to_date(value, self.format), selections
 
-    def compare(self, max_factual: dt.date, max_target: dt.date) -> Tuple[bool, str]:
+    def compare(
+        self, max_factual: dt.date, max_target: dt.date
+    ) -> Tuple[bool, Optional[str]]:
         if max_factual is None:
             return True, None
         if max_target is None:
             return max_factual == 0, "Empty reference set."
         if self.use_upper_bound_reference:
-            assertion_text = (
-                f"{self.ref} has max {max_factual} > "
-                f"{self.target_prefix} {max_target}. "
-                f"{self.condition_string}"
-            )
             result = max_factual <= max_target
+            relation = ">"
         else:
-            assertion_text = (
-                f"{self.ref} has max {max_factual} < "
-                f"{self.target_prefix} {max_target}. "
-                f"{self.condition_string}"
-            )
             result = max_factual >= max_target
-
-        return result, assertion_text
+            relation = "<"
+        if result:
+            return True, None
+        assertion_text = (
+            f"{self.ref} has max {max_factual} {relation} "
+            f"{self.target_prefix} {max_target}. "
+            f"{self.condition_string}"
+        )
+        return False, assertion_text
 
 
 class DateBetween(Constraint):
@@ -162,55 +194,37 @@ class DateBetween(Constraint):
 
     def compare(
         self, fraction_factual: float, fraction_target: float
-    ) -> Tuple[bool, str]:
+    ) -> Tuple[bool, Optional[str]]:
+        if fraction_factual >= fraction_target:
+            return True, None
         assertion_text = (
             f"{self.ref} has {fraction_factual} < "
             f"{fraction_target} of values between {self.lower_bound} and "
             f"{self.upper_bound}. {self.condition_string} "
         )
-        result = fraction_factual >= fraction_target
-        return result, assertion_text
+        return False, assertion_text
 
 
 class DateNoOverlap(NoOverlapConstraint):
     _DIMENSIONS = 1
-
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        n_violation_keys, n_distinct_key_values = factual
-        if n_distinct_key_values == 0:
-            return TestResult.success()
-        violation_fraction = n_violation_keys / n_distinct_key_values
-        assertion_text = (
-            f"{self.ref} has a ratio of {violation_fraction} > "
-            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
-            f"with overlapping date ranges in {self.start_columns[0]} and {self.end_columns[0]}."
-            f"E.g. for: {self.sample}."
-        )
-        result = violation_fraction <= self.max_relative_n_violations
-        return result, assertion_text
+    _VIOLATION_TEMPLATE = (
+        "overlapping date ranges in {start_columns[0]} and {end_columns[0]}"
+    )
 
 
 class DateNoOverlap2d(NoOverlapConstraint):
     _DIMENSIONS = 2
-
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        n_violation_keys, n_distinct_key_values = factual
-        if n_distinct_key_values == 0:
-            return TestResult.success()
-        violation_fraction = n_violation_keys / n_distinct_key_values
-        assertion_text = (
-            f"{self.ref} has a ratio of {violation_fraction} > "
-            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
-            f"with overlapping date ranges in {self.start_columns[0]} and {self.end_columns[0]}."
-            f"and {self.start_columns[1]} and {self.end_columns[1]}."
-            f"E.g. for: {self.sample}."
-        )
-        result = violation_fraction <= self.max_relative_n_violations
-        return result, assertion_text
+    _VIOLATION_TEMPLATE = (
+        "overlapping date ranges in {start_columns[0]} and {end_columns[0]}."
+        "and {start_columns[1]} and {end_columns[1]}"
+    )
 
 
 class DateNoGap(NoGapConstraint):
     _DIMENSIONS = 1
+    _VIOLATION_TEMPLATE = (
+        "a gap in the date range in {start_columns[0]} and {end_columns[0]}"
+    )
 
     def select(self, engine: sa.engine.Engine, ref: DataReference):
         sample_selection, n_violations_selection = db_access.get_date_gaps(
@@ -221,20 +235,4 @@ class DateNoGap(NoGapConstraint):
             self.end_columns[0],
             self.legitimate_gap_size,
         )
-        # TODO: Once get_unique_count also only returns a selection without
-        # executing it, one would want to list this selection here as well.
         return sample_selection, n_violations_selection
-
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        n_violation_keys, n_distinct_key_values = factual
-        if n_distinct_key_values == 0:
-            return TestResult.success()
-        violation_fraction = n_violation_keys / n_distinct_key_values
-        assertion_text = (
-            f"{self.ref} has a ratio of {violation_fraction} > "
-            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
-            f"with a gap in the date range in {self.start_columns[0]} and {self.end_columns[0]}."
-            f"E.g. for: {self.sample}."
-        )
-        result = violation_fraction <= self.max_relative_n_violations
-        return result, assertion_text
@@ -28,20 +28,21 @@ class AggregateNumericRangeEquality(Constraint):
     def retrieve(
         self, engine: sa.engine.Engine, ref: DataReference
     ) -> Tuple[Any, OptionalSelections]:
-        result, selections = db_access.get_column_array_agg(
-            engine, ref, self.aggregation_column
+        return db_access.get_missing_from_range(
+            engine, ref, self.aggregation_column, self.start_value
         )
-        result = {fact[:-1]: fact[-1] for fact in result}
-        return result, selections
 
     def compare(self, factual: Any, target: Any) -> Tuple[bool, Optional[str]]:
         def missing_from_range(values, start=0):
-            return set(range(start, max(values) + start)) - set(values)
-
-        results = {
-            k: missing_from_range(v, self.start_value) for k, v in factual.items()
+            present = set(values)
+            return {i for i in range(start, max(present) + start) if i not in present}
+
+        # Only groups with missing values come with their values.
+        failed_results = {
+            k: missing_from_range(values, self.start_value)
+            for k, (n_missing, values) in factual.items()
+            if n_missing > 0
         }
-        failed_results = dict(filter(lambda x: len(x[1]) > 0, results.items()))
 
         if len(failed_results) / len(factual) > self.tolerance:
             assertion_text = (
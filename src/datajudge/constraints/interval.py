@@ -10,6 +10,9 @@ from .base import Constraint, OptionalSelections
 
 class IntervalConstraint(Constraint):
     _DIMENSIONS = 0
+    # Describes the violations in the assertion text, formatted with the start and
+    # end columns.
+    _VIOLATION_TEMPLATE = ""
 
     def __init__(
         self,
@@ -50,19 +53,38 @@ class IntervalConstraint(Constraint):
             columns=self.key_columns,
             condition=self.ref.condition,
         )
-        n_distinct_key_values, n_keys_selections = db_access.get_unique_count(
-            engine, keys_ref
-        )
-
         sample_selection, n_violations_selection = self.select(engine, ref)
-        with engine.connect() as connection:
-            self.sample = connection.execute(sample_selection).first()
-            n_violation_keys = int(
-                str(connection.execute(n_violations_selection).scalar())
-            )
-
-        selections = [*n_keys_selections, sample_selection, n_violations_selection]
-        return (n_violation_keys, n_distinct_key_values), selections
+        if self.max_relative_n_violations == 0:
+            # Without tolerance, a single violation suffices to fail. Only count the
+            # violations and keys once there is one, for the assertion text.
+            sample, selections = db_access.get_sample(engine, sample_selection)
+            if sample is None:
+                self.sample = None
+                return (0, 0), selections
+        counts, self.sample, selections = db_access.get_interval_violations(
+            engine, sample_selection, n_violations_selection, keys_ref
+        )
+        return counts, selections
+
+    def compare(
+        self, factual: Tuple[int, int], target: Any
+    ) -> Tuple[bool, Optional[str]]:
+        n_violation_keys, n_distinct_key_values = factual
+        if n_distinct_key_values == 0:
+            return True, None
+        violation_fraction = n_violation_keys / n_distinct_key_values
+        if violation_fraction <= self.max_relative_n_violations:
+            return True, None
+        violations = self._VIOLATION_TEMPLATE.format(
+            start_columns=self.start_columns, end_columns=self.end_columns
+        )
+        assertion_text = (
+            f"{self.ref} has a ratio of {violation_fraction} > "
+            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
+            f"with {violations}."
+            f"E.g. for: {self.sample}."
+        )
+        return False, assertion_text
 
 
 class NoOverlapConstraint(IntervalConstraint):
@@ -97,14 +119,8 @@ class NoOverlapConstraint(IntervalConstraint):
             end_columns=self.end_columns,
             end_included=self.end_included,
         )
-        # TODO: Once get_unique_count also only returns a selection without
-        # executing it, one would want to list this selection here as well.
         return sample_selection, n_violations_selection
 
-    @abc.abstractmethod
-    def compare(self, factual: Any, target: Any):
-        pass
-
 
 class NoGapConstraint(IntervalConstraint):
     def __init__(
@@ -132,7 +148,3 @@ class NoGapConstraint(IntervalConstraint):
     @abc.abstractmethod
     def select(self, engine: sa.engine.Engine, ref: DataReference):
         pass
-
-    @abc.abstractmethod
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        pass
@@ -1,5 +1,5 @@
 import warnings
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 import sqlalchemy as sa
 
@@ -16,40 +16,35 @@ class PrimaryKeyDefinition(Constraint):
         name: Optional[str] = None,
         cache_size=None,
     ):
-        super().__init__(ref, ref_value=set(primary_keys), name=name)
+        super().__init__(ref, ref_value=frozenset(primary_keys), name=name)
 
     def retrieve(
         self, engine: sa.engine.Engine, ref: DataReference
-    ) -> Tuple[Set[str], OptionalSelections]:
+    ) -> Tuple[FrozenSet[str], OptionalSelections]:
         if db_access.is_impala(engine):
             raise NotImplementedError("Primary key retrieval does not work for Impala.")
         values, selections = db_access.get_primary_keys(engine, self.ref)
-        return set(values), selections
+        return frozenset(values), selections
 
     # Note: Exact equality!
     def compare(
-        self, primary_keys_factual: Set[str], primary_keys_target: Set[str]
+        self,
+        primary_keys_factual: FrozenSet[str],
+        primary_keys_target: FrozenSet[str],
     ) -> Tuple[bool, Optional[str]]:
-        assertion_message = ""
-        result = True
-        # If both are true, just report one.
-        if len(primary_keys_factual.difference(primary_keys_target)) > 0:
-            example_key = next(
-                iter(primary_keys_factual.difference(primary_keys_target))
-            )
-            assertion_message = (
-                f"{self.ref} incorrectly includes " f"{example_key} as primary key."
-            )
-            result = False
-        if len(primary_keys_target.difference(primary_keys_factual)) > 0:
-            example_key = next(
-                iter(primary_keys_target.difference(primary_keys_factual))
-            )
-            assertion_message = (
-                f"{self.ref} doesn't include " f"{example_key} as primary key."
-            )
-            result = False
-        return result, assertion_message
+        if primary_keys_factual == primary_keys_target:
+            return True, ""
+        # If keys are both missing and superfluous, just report a missing one.
+        missing_key = next(
+            (key for key in primary_keys_target if key not in primary_keys_factual),
+            None,
+        )
+        if missing_key is not None:
+            return False, f"{self.ref} doesn't include {missing_key} as primary key."
+        extra_key = next(
+            key for key in primary_keys_factual if key not in primary_keys_target
+        )
+        return False, f"{self.ref} incorrectly includes {extra_key} as primary key."
 
 
 class Uniqueness(Constraint):
@@ -81,28 +76,34 @@ class Uniqueness(Constraint):
         super().__init__(ref, ref_value=ref_value, name=name, cache_size=cache_size)
 
     def test(self, engine: sa.engine.Engine) -> TestResult:
-        if self.infer_pk_columns and db_access.is_bigquery(engine):
-            raise NotImplementedError("No primary key concept in BigQuery")
-
-        # only check for primary keys when actually defined
-        # otherwise default back to searching the whole table
-        if self.infer_pk_columns and (
-            pk_columns := db_access.get_primary_keys(engine, self.ref)[0]
-        ):
-            self.ref.columns = pk_columns
-            if not pk_columns:  # there were no primary keys found
+        if self.infer_pk_columns:
+            if db_access.is_bigquery(engine):
+                raise NotImplementedError("No primary key concept in BigQuery")
+            # only check for primary keys when actually defined
+            # otherwise default back to searching the whole table
+            if pk_columns := db_access.get_primary_keys(engine, self.ref)[0]:
+                self.ref.columns = pk_columns
+            else:
                 warnings.warn(
                     f"""No primary keys found in {self.ref}.
                     Uniqueness will be tested for all columns."""
                 )
 
-        unique_count, unique_selections = db_access.get_unique_count(engine, self.ref)
-        row_count, row_selections = db_access.get_row_count(engine, self.ref)
-        self.factual_selections = row_selections
-        self.target_selections = unique_selections
+        tolerance_kind, tolerance_value = self.ref_value  # type: ignore
+        sample = None
+        if tolerance_value == 0:
+            # Without tolerance, a single duplicate suffices to fail. Only count the
+            # rows and uniques once there is one, for the assertion text.
+            sample, _ = db_access.get_duplicate_sample(engine, self.ref)
+            if sample is None:
+                return TestResult.success()
+
+        (row_count, unique_count), selections = db_access.get_row_and_unique_counts(
+            engine, self.ref
+        )
+        self.factual_selections = selections
         if row_count == 0:
             return TestResult(True, "No occurrences.")
-        tolerance_kind, tolerance_value = self.ref_value  # type: ignore
         if tolerance_kind == "relative":
             result = unique_count >= row_count * (1 - tolerance_value)
         elif tolerance_kind == "absolute":
@@ -113,7 +114,8 @@ class Uniqueness(Constraint):
             )
         if result:
             return TestResult.success()
-        sample, _ = db_access.get_duplicate_sample(engine, self.ref)
+        if sample is None:
+            sample, _ = db_access.get_duplicate_sample(engine, self.ref)
         sample_string = format_sample(sample, self.ref)
         assertion_text = (
             f"{self.ref} has {row_count} rows > {unique_count} "
@@ -186,9 +188,10 @@ class MaxNullFraction(Constraint):
         self, missing_fraction_factual: float, missing_fracion_target: float
     ) -> Tuple[bool, Optional[str]]:
         threshold = missing_fracion_target * (1 + self.max_relative_deviation)
-        result = missing_fraction_factual <= threshold
+        if missing_fraction_factual <= threshold:
+            return True, None
         assertion_text = (
             f"{missing_fraction_factual} of {self.ref} values are NULL "
             f"while only {self.target_prefix}{threshold} were allowed to be NULL."
         )
-        return result, assertion_text
+        return False, assertion_text
@@ -1,12 +1,18 @@
 import abc
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 import sqlalchemy as sa
 
 from .. import db_access
 from ..db_access import DataReference
 from ..utils import format_difference
-from .base import Constraint, OptionalSelections, TestResult, ToleranceGetter
+from .base import (
+    Constraint,
+    OptionalSelections,
+    TestResult,
+    ToleranceGetter,
+    cache_per_engine,
+)
 
 
 class NRows(Constraint, abc.ABC):
@@ -26,12 +32,25 @@ class NRows(Constraint, abc.ABC):
             name=name,
             cache_size=cache_size,
         )
+        self._row_counts: Dict[sa.engine.Engine, Tuple[int, int]] = {}
 
     def retrieve(
         self, engine: sa.engine.Engine, ref: DataReference
     ) -> Tuple[int, OptionalSelections]:
         return db_access.get_row_count(engine, ref)
 
+    def get_values(self, engine: sa.engine.Engine) -> Tuple[Any, Any]:
+        if self.ref2 is None:
+            return super().get_values(engine)
+        return self.get_row_counts(engine)
+
+    @cache_per_engine("_row_counts")
+    def get_row_counts(self, engine: sa.engine.Engine) -> Tuple[int, int]:
+        # Count the rows of both DataReferences in a single query.
+        row_counts, selections = db_access.get_row_counts(engine, self.ref, self.ref2)
+        self.factual_selections = selections
+        return row_counts
+
 
 class NRowsMin(NRows):
     def retrieve(
@@ -47,19 +66,25 @@ class NRowsMin(NRows):
         # bigint, which we do by default.
         return db_access.get_row_count(engine=engine, ref=ref, row_limit=self.ref_value)
 
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
-        result = n_rows_factual >= n_rows_target
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
+        if n_rows_factual >= n_rows_target:
+            return True, None
         assertion_text = (
             f"{self.ref} has {n_rows_factual} "
             f"< {self.target_prefix} {n_rows_target} rows. "
             f"{self.condition_string}"
         )
-        return result, assertion_text
+        return False, assertion_text
 
 
 class NRowsMax(NRows):
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
-        result = n_rows_factual <= n_rows_target
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
+        if n_rows_factual <= n_rows_target:
+            return True, None
         n_rows_factual_fmt, n_rows_target_fmt = format_difference(
             n_rows_factual, n_rows_target
         )
@@ -68,12 +93,15 @@ class NRowsMax(NRows):
             f"> {self.target_prefix} {n_rows_target_fmt} rows. "
             f"{self.condition_string}"
         )
-        return result, assertion_text
+        return False, assertion_text
 
 
 class NRowsEquality(NRows):
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
-        result = n_rows_factual == n_rows_target
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
+        if n_rows_factual == n_rows_target:
+            return True, None
         n_rows_factual_fmt, n_rows_target_fmt = format_difference(
             n_rows_factual, n_rows_target
         )
@@ -82,10 +110,24 @@ class NRowsEquality(NRows):
             f"instead of {self.target_prefix} {n_rows_target_fmt}. "
             f"{self.condition_string}"
         )
-        return result, assertion_text
+        return False, assertion_text
+
+
+class _NRowsRelativeChange(NRows):
+    # The attribute holding the relative change tolerance. It is obtained anew for
+    # every test from the getter stored under the same name, suffixed by ``_getter``.
+    _TOLERANCE_ATTRIBUTE = ""
+
+    def test(self, engine: sa.engine.Engine) -> TestResult:
+        tolerance_getter = getattr(self, f"{self._TOLERANCE_ATTRIBUTE}_getter")
+        setattr(self, self._TOLERANCE_ATTRIBUTE, tolerance_getter(engine))
+        return super().test(engine)
+
 
+class NRowsMaxLoss(_NRowsRelativeChange):
+    _TOLERANCE_ATTRIBUTE = "max_relative_loss"
+    max_relative_loss: float
 
-class NRowsMaxLoss(NRows):
     def __init__(
         self,
         ref: DataReference,
@@ -97,27 +139,29 @@ class NRowsMaxLoss(NRows):
         super().__init__(ref, ref2=ref2, name=name, cache_size=cache_size)
         self.max_relative_loss_getter = max_relative_loss_getter
 
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
         if n_rows_target == 0:
             return True, "Empty target table."
         if n_rows_factual > n_rows_target:
             return True, "Row gain."
         relative_loss = (n_rows_target - n_rows_factual) / n_rows_target
+        if relative_loss <= self.max_relative_loss:
+            return True, None
         assertion_text = (
             f"The #rows from {self.ref} have decreased by "
             f"{relative_loss:%} compared to table {self.ref2}. "
             f"They were expected to decrease by at most {self.max_relative_loss:%}. "
             f"{self.condition_string}"
         )
-        result = relative_loss <= self.max_relative_loss
-        return result, assertion_text
+        return False, assertion_text
 
-    def test(self, engine: sa.engine.Engine) -> TestResult:
-        self.max_relative_loss = self.max_relative_loss_getter(engine)
-        return super().test(engine)
 
+class NRowsMaxGain(_NRowsRelativeChange):
+    _TOLERANCE_ATTRIBUTE = "max_relative_gain"
+    max_relative_gain: float
 
-class NRowsMaxGain(NRows):
     def __init__(
         self,
         ref: DataReference,
@@ -129,27 +173,29 @@ class NRowsMaxGain(NRows):
         super().__init__(ref, ref2=ref2, name=name, cache_size=cache_size)
         self.max_relative_gain_getter = max_relative_gain_getter
 
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
         if n_rows_target == 0:
             return True, "Empty target table."
         if n_rows_factual < n_rows_target:
             return True, "Row loss."
         relative_gain = (n_rows_factual - n_rows_target) / n_rows_target
+        if relative_gain <= self.max_relative_gain:
+            return True, None
         assertion_text = (
             f"{self.ref} has {relative_gain:%} gain in #rows compared to "
             f"{self.ref2}. It was only allowed "
             f"to increase by {self.max_relative_gain:%}. "
             f"{self.condition_string}"
         )
-        result = relative_gain <= self.max_relative_gain
-        return result, assertion_text
+        return False, assertion_text
 
-    def test(self, engine: sa.engine.Engine) -> TestResult:
-        self.max_relative_gain = self.max_relative_gain_getter(engine)
-        return super().test(engine)
 
+class NRowsMinGain(_NRowsRelativeChange):
+    _TOLERANCE_ATTRIBUTE = "min_relative_gain"
+    min_relative_gain: float
 
-class NRowsMinGain(NRows):
     def __init__(
         self,
         ref: DataReference,
@@ -161,21 +207,20 @@ class NRowsMinGain(NRows):
         super().__init__(ref, ref2=ref2, name=name, cache_size=cache_size)
         self.min_relative_gain_getter = min_relative_gain_getter
 
-    def compare(self, n_rows_factual: int, n_rows_target: int) -> Tuple[bool, str]:
+    def compare(
+        self, n_rows_factual: int, n_rows_target: int
+    ) -> Tuple[bool, Optional[str]]:
         if n_rows_target == 0:
             return True, "Empty target table."
         if n_rows_factual < n_rows_target:
             return False, "Row loss."
         relative_gain = (n_rows_factual - n_rows_target) / n_rows_target
+        if relative_gain >= self.min_relative_gain:
+            return True, None
         assertion_text = (
             f"{self.ref} has {relative_gain:%} gain in #rows compared to "
             f"{self.ref2}. It was supposed "
             f"to increase at least by {self.min_relative_gain:%}. "
             f"{self.condition_string}"
         )
-        result = relative_gain >= self.min_relative_gain
-        return result, assertion_text
-
-    def test(self, engine: sa.engine.Engine) -> TestResult:
-        self.min_relative_gain = self.min_relative_gain_getter(engine)
-        return super().test(engine)
+        return False, assertion_text
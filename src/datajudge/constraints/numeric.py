@@ -1,10 +1,10 @@
-from typing import Any, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import sqlalchemy as sa
 
 from .. import db_access
 from ..db_access import DataReference
-from .base import Constraint, OptionalSelections, TestResult
+from .base import Constraint, OptionalSelections, TestResult, cache_per_engine
 from .interval import NoGapConstraint, NoOverlapConstraint
 
 
@@ -38,14 +38,15 @@ class NumericMin(Constraint):
             return True, None
         if min_factual is None:
             return min_target == 0, "Empty set."
+        if min_factual >= min_target:
+            return True, None
         assertion_text = (
             f"{self.ref} has min "
             f"{min_factual} instead of {self.target_prefix}"
             f"{min_target} . "
             f"{self.condition_string}"
         )
-        result = min_factual >= min_target
-        return result, assertion_text
+        return False, assertion_text
 
 
 class NumericMax(Constraint):
@@ -78,14 +79,15 @@ class NumericMax(Constraint):
             return True, None
         if max_target is None:
             return max_factual == 0, "Empty reference set."
+        if max_factual <= max_target:
+            return True, None
         assertion_text = (
             f"{self.ref} has max "
             f"{max_factual} instead of {self.target_prefix}"
             f"{max_target}. "
             f"{self.condition_string}"
         )
-        result = max_factual <= max_target
-        return result, assertion_text
+        return False, assertion_text
 
 
 class NumericBetween(Constraint):
@@ -117,14 +119,15 @@ class NumericBetween(Constraint):
     ) -> Tuple[bool, Optional[str]]:
         if fraction_factual is None:
             return True, "Empty selection."
+        if fraction_factual >= fraction_target:
+            return True, None
         assertion_text = (
             f"{self.ref} "
             f"has {fraction_factual} < {fraction_target} of rows "
             f"between {self.lower_bound} and {self.upper_bound}. "
             f"{self.condition_string}"
         )
-        result = fraction_factual >= fraction_target
-        return result, assertion_text
+        return False, assertion_text
 
 
 class NumericMean(Constraint):
@@ -146,6 +149,7 @@ class NumericMean(Constraint):
             cache_size=cache_size,
         )
         self.max_absolute_deviation = max_absolute_deviation
+        self._means: Dict[sa.engine.Engine, Tuple[float, float]] = {}
 
     def retrieve(
         self, engine: sa.engine.Engine, ref: DataReference
@@ -153,15 +157,26 @@ class NumericMean(Constraint):
         result, selections = db_access.get_mean(engine, ref)
         return result, selections
 
+    @cache_per_engine("_means")
+    def get_means(self, engine: sa.engine.Engine) -> Tuple[float, float]:
+        if self.ref2 is not None and db_access.shares_data_source(
+            engine, self.ref, self.ref2
+        ):
+            means, selections = db_access.get_means(engine, self.ref, self.ref2)
+            self.factual_selections = selections
+            return means
+        return self.get_factual_value(engine), self.get_target_value(engine)
+
     def test(self, engine: sa.engine.Engine) -> TestResult:
-        mean_factual = self.get_factual_value(engine)
-        mean_target = self.get_target_value(engine)
+        mean_factual, mean_target = self.get_means(engine)
         if mean_factual is None or mean_target is None:
             return TestResult(
                 mean_factual is None and mean_target is None,
                 "Mean over empty set.",
             )
         deviation = abs(mean_factual - mean_target)
+        if deviation <= self.max_absolute_deviation:
+            return TestResult.success()
         assertion_text = (
             f"{self.ref} "
             f"has mean {mean_factual}, deviating more than "
@@ -169,8 +184,7 @@ class NumericMean(Constraint):
             f"{self.target_prefix} {mean_target}. "
             f"{self.condition_string}"
         )
-        result = deviation <= self.max_absolute_deviation
-        return TestResult(result, assertion_text)
+        return TestResult.failure(assertion_text)
 
 
 class NumericPercentile(Constraint):
@@ -255,6 +269,9 @@ class NumericPercentile(Constraint):
 
 class NumericNoGap(NoGapConstraint):
     _DIMENSIONS = 1
+    _VIOLATION_TEMPLATE = (
+        "a gap in the range in {start_columns[0]} and {end_columns[0]}"
+    )
 
     def select(self, engine: sa.engine.Engine, ref: DataReference):
         sample_selection, n_violations_selection = db_access.get_numeric_gaps(
@@ -265,38 +282,11 @@ class NumericNoGap(NoGapConstraint):
             self.end_columns[0],
             self.legitimate_gap_size,
         )
-        # TODO: Once get_unique_count also only returns a selection without
-        # executing it, one would want to list this selection here as well.
         return sample_selection, n_violations_selection
 
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        n_violation_keys, n_distinct_key_values = factual
-        if n_distinct_key_values == 0:
-            return TestResult.success()
-        violation_fraction = n_violation_keys / n_distinct_key_values
-        assertion_text = (
-            f"{self.ref} has a ratio of {violation_fraction} > "
-            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
-            f"with a gap in the range in {self.start_columns[0]} and {self.end_columns[0]}."
-            f"E.g. for: {self.sample}."
-        )
-        result = violation_fraction <= self.max_relative_n_violations
-        return result, assertion_text
-
 
 class NumericNoOverlap(NoOverlapConstraint):
     _DIMENSIONS = 1
-
-    def compare(self, factual: Tuple[int, int], target: Any) -> Tuple[bool, str]:
-        n_violation_keys, n_distinct_key_values = factual
-        if n_distinct_key_values == 0:
-            return TestResult.success()
-        violation_fraction = n_violation_keys / n_distinct_key_values
-        assertion_text = (
-            f"{self.ref} has a ratio of {violation_fraction} > "
-            f"{self.max_relative_n_violations} keys in columns {self.key_columns} "
-            f"with overlapping ranges in {self.start_columns[0]} and {self.end_columns[0]}."
-            f"E.g. for: {self.sample}."
-        )
-        result = violation_fraction <= self.max_relative_n_violations
-        return result, assertion_text
+    _VIOLATION_TEMPLATE = (
+        "overlapping ranges in {start_columns[0]} and {end_columns[0]}"
+    )
@@ -1,12 +1,16 @@
 import abc
-from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import sqlalchemy as sa
 
 from .. import db_access
 from ..db_access import DataReference, MatchAndCompare
-from .base import Constraint, TestResult, ToleranceGetter, format_sample
+from .base import (
+    Constraint,
+    TestResult,
+    ToleranceGetter,
+    format_sample,
+)
 
 
 class Row(Constraint, abc.ABC):
@@ -78,7 +82,6 @@ class RowEquality(Row):
 
 
 class RowSubset(Row):
-    @lru_cache(maxsize=None)
     def get_factual_value(self, engine: sa.engine.Engine) -> int:
         n_rows_missing, selections = db_access.get_row_difference_count(
             engine,
@@ -88,13 +91,11 @@ class RowSubset(Row):
         self.factual_selections = selections
         return n_rows_missing
 
-    @lru_cache(maxsize=None)
     def get_target_value(self, engine: sa.engine.Engine) -> int:
         n_rows_total, selections = db_access.get_unique_count(engine, self.ref)
         self.target_selections = selections
         return n_rows_total
 
-    @lru_cache(maxsize=None)
     def compare(
         self, n_rows_missing: int, n_rows_total: int
     ) -> Tuple[bool, Optional[str]]:
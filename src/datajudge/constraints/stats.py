@@ -80,21 +80,17 @@ class KolmogorovSmirnov2Sample(Constraint):
         ref2: DataReference,
     ) -> Tuple[float, Optional[float], int, int, List]:
         # retrieve test statistic d, as well as sample sizes m and n
-        d_statistic, ks_selections = db_access.get_ks_2sample(
+        (d_statistic, n_samples, m_samples), selections = db_access.get_ks_2sample(
             engine,
             ref1,
             ref2,
         )
 
-        n_samples, n_selections = db_access.get_row_count(engine, ref1)
-        m_samples, m_selections = db_access.get_row_count(engine, ref2)
-
         # calculate approximate p-value
         p_value = KolmogorovSmirnov2Sample.approximate_p_value(
             d_statistic, n_samples, m_samples
         )
 
-        selections = n_selections + m_selections + ks_selections
         return d_statistic, p_value, n_samples, m_samples, selections
 
     def test(self, engine: sa.engine.Engine) -> TestResult:
@@ -125,17 +121,12 @@ class KolmogorovSmirnov2Sample(Constraint):
             assertion_text += f" and {p_value=}"
         assertion_text += "."
 
-        if selections:
-            queries = [
-                str(selection.compile(engine, compile_kwargs={"literal_binds": True}))
-                for selection in selections
-            ]
-
         if not result:
             return TestResult.failure(
                 assertion_text,
                 self.get_description(),
-                queries,
+                _engine=engine,
+                _factual_selections=selections,
             )
 
         return TestResult.success()
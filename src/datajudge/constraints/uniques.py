@@ -9,7 +9,14 @@ import sqlalchemy as sa
 
 from .. import db_access
 from ..db_access import DataReference
-from ..utils import OutputProcessor, filternull_element, output_processor_limit
+from ..utils import (
+    OutputProcessor,
+    filternull_element,
+    filternull_element_or_tuple_all,
+    filternull_element_or_tuple_any,
+    filternull_never,
+    output_processor_limit,
+)
 from .base import Constraint, OptionalSelections, T, TestResult, ToleranceGetter
 
 
@@ -37,6 +44,31 @@ def _subset_violation_counts(
     return len(remainder) == 0, remainder
 
 
+def _get_sql_null_filter(
+    filter_func: Callable, n_columns: int
+) -> Tuple[bool, Optional[Callable[[List[sa.ColumnElement]], sa.ColumnElement]]]:
+    """Express one of the predefined null filter functions as a SQL predicate.
+
+    Returns whether ``filter_func`` could be translated and, if anything needs to be
+    filtered at all, a function building the predicate from the respective columns.
+    """
+    if filter_func is filternull_never or (
+        filter_func is filternull_element and n_columns > 1
+    ):
+        return True, None
+    if n_columns == 1 and filter_func in (
+        filternull_element,
+        filternull_element_or_tuple_all,
+        filternull_element_or_tuple_any,
+    ):
+        return True, lambda columns: columns[0].is_not(None)
+    if filter_func is filternull_element_or_tuple_all:
+        return True, lambda columns: sa.or_(*[c.is_not(None) for c in columns])
+    if filter_func is filternull_element_or_tuple_any:
+        return True, lambda columns: sa.and_(*[c.is_not(None) for c in columns])
+    return False, None
+
+
 class Uniques(Constraint, abc.ABC):
     """Uniques is an abstract class for comparisons between unique values of a column and a reference.
 
@@ -170,6 +202,43 @@ class UniquesEquality(Uniques):
             raise RuntimeError("compare_distinct is not supported for UniquesEquality.")
         super().__init__(args, name=name, **kwargs)
 
+    def _are_uniques_equal_in_database(self, engine: sa.engine.Engine) -> bool:
+        """Check for equality without fetching the unique values, if possible."""
+        if self.ref2 is None or self.local_func or self.global_func:
+            return False
+        # Impala lacks EXCEPT, BigQuery requires EXCEPT DISTINCT and MSSQL's default
+        # collations as well as DB2's blank-padded comparisons compare strings
+        # differently than Python does, e.g. 'a' and 'a ' are considered equal.
+        if (
+            db_access.is_impala(engine)
+            or db_access.is_bigquery(engine)
+            or db_access.is_mssql(engine)
+            or db_access.is_db2(engine)
+        ):
+            return False
+        columns = self.ref.get_columns(engine) or []
+        if not columns or len(columns) != len(self.ref2.get_columns(engine) or []):
+            return False
+        is_translatable, null_filter = _get_sql_null_filter(
+            self.filter_func, len(columns)
+        )
+        if not is_translatable:
+            return False
+        try:
+            differs, _ = db_access.has_uniques_difference(
+                engine, self.ref, self.ref2, null_filter
+            )
+        except sa.exc.SQLAlchemyError:
+            # E.g. incompatible column types, let Python compare the values instead.
+            return False
+        return not differs
+
+    def test(self, engine: sa.engine.Engine) -> TestResult:
+        # Only fetch all unique values if they are needed for the assertion message.
+        if self._are_uniques_equal_in_database(engine):
+            return TestResult.success()
+        return super().test(engine)
+
     def compare(
         self,
         factual: Tuple[List[T], List[int]],
@@ -116,18 +116,15 @@ class VarCharRegex(Constraint):
             return TestResult.failure("No regex pattern given")
 
         pattern = re.compile(self.ref_value)
-        uniques_mismatching = {
-            x
-            for x in uniques_factual
-            if not pattern.match(x)  # type: ignore
-        }
+        # Let filterfalse drive the matching rather than a Python-level loop.
+        uniques_mismatching = set(itertools.filterfalse(pattern.match, uniques_factual))
 
         if self.aggregated:
             n_violations = len(uniques_mismatching)
             n_total = len(uniques_factual)
         else:
             n_violations = sum(uniques_counter[key] for key in uniques_mismatching)
-            n_total = sum(count for _, count in uniques_counter.items())
+            n_total = sum(uniques_counter.values())
 
         n_relative_violations = n_violations / n_total
 
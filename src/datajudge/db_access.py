@@ -3,10 +3,14 @@ from __future__ import annotations
 import functools
 import json
 import operator
+import sys
+import threading
 from abc import ABC, abstractmethod
-from collections import Counter
-from dataclasses import dataclass
-from typing import Any, Callable, Sequence, final, overload
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Sequence, final, overload
 
 import sqlalchemy as sa
 from sqlalchemy.sql import selectable
@@ -37,6 +41,42 @@ def is_db2(engine: sa.engine.Engine) -> bool:
     return engine.name == "ibm_db_sa"
 
 
+# The connection that queries against an engine share within ``shared_connection``.
+_shared_connection: ContextVar[tuple[sa.engine.Engine, sa.engine.Connection] | None] = (
+    ContextVar("_shared_connection", default=None)
+)
+
+
+@contextmanager
+def shared_connection(engine: sa.engine.Engine) -> Iterator[sa.engine.Connection]:
+    """Let all queries against ``engine`` within this context use one connection.
+
+    Rather than checking out a connection per query, e.g. for the factual and the
+    target value of a constraint, the queries are sent over the same connection.
+    """
+    shared = _shared_connection.get()
+    if shared is not None and shared[0] is engine:
+        yield shared[1]
+        return
+    with engine.connect() as connection:
+        token = _shared_connection.set((engine, connection))
+        try:
+            yield connection
+        finally:
+            _shared_connection.reset(token)
+
+
+@contextmanager
+def connect(engine: sa.engine.Engine):
+    """Use the connection shared within ``shared_connection`` or a new one."""
+    shared = _shared_connection.get()
+    if shared is not None and shared[0] is engine:
+        yield shared[1]
+        return
+    with engine.connect() as connection:
+        yield connection
+
+
 def get_table_columns(table, column_names):
     return [table.c[column_name] for column_name in column_names]
 
@@ -93,7 +133,11 @@ def lowercase_column_names(column_names: str | list[str]) -> str | list[str]:
     return [column_name.lower() for column_name in column_names]
 
 
-@dataclass(frozen=True)
+# Slotted dataclasses are only available from Python 3.10 onwards.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Condition:
     """Condition allows for further narrowing down of a DataSource in a Constraint.
 
@@ -118,6 +162,8 @@ class Condition:
     raw_string: str | None = None
     conditions: Sequence[Condition] | None = None
     reduction_operator: str | None = None
+    # Conditions are immutable, hence their string representation is only built once.
+    _str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self._is_atomic() and self.conditions is not None:
@@ -146,6 +192,11 @@ class Condition:
         return self.raw_string is not None
 
     def __str__(self):
+        if self._str is None:
+            object.__setattr__(self, "_str", self._build_str())
+        return self._str
+
+    def _build_str(self):
         if self._is_atomic():
             return self.raw_string
         if not self.conditions:
@@ -218,6 +269,35 @@ def get_metadata():
     return sa.MetaData()
 
 
+# Reflecting tables mutates the shared ``MetaData`` object which is not safe to do
+# from several threads at once, e.g. when testing constraints concurrently.
+_metadata_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _TableMetadata:
+    column_names: tuple[str, ...]
+    primary_keys: tuple[str, ...]
+    column_types: dict[str, sa.types.TypeEngine]
+
+
+# Introspection results per engine url and table, s.t. constraints on the same
+# table don't need to consult the reflected ``sa.Table`` over and over again.
+_table_metadata_cache: dict[tuple[str, str, str | None, str], _TableMetadata] = {}
+
+
+def clear_metadata_cache() -> None:
+    """Forget all reflected table metadata.
+
+    Reflected tables and their column names, column types and primary keys are
+    cached for the lifetime of the process. Call this function if tables have been altered in
+    the meantime.
+    """
+    with _metadata_lock:
+        _table_metadata_cache.clear()
+        get_metadata().clear()
+
+
 @final
 class TableDataSource(DataSource):
     def __init__(
@@ -235,17 +315,76 @@ class TableDataSource(DataSource):
             return f"{self.db_name}.{self.schema_name}.{self.table_name}"
         return self.table_name
 
-    def get_clause(self, engine: sa.engine.Engine) -> FromClause:
-        schema = self.schema_name
+    def get_schema(self, engine: sa.engine.Engine) -> str | None:
         if is_mssql(engine):
-            schema = self.db_name + "." + self.schema_name  # type: ignore
+            return self.db_name + "." + self.schema_name  # type: ignore
+        return self.schema_name
+
+    def get_clause(self, engine: sa.engine.Engine) -> sa.Table:
+        with _metadata_lock:
+            return sa.Table(
+                self.table_name,
+                get_metadata(),
+                autoload_with=engine,
+                schema=self.get_schema(engine),
+            )
+
 
-        return sa.Table(
-            self.table_name,
-            get_metadata(),
-            autoload_with=engine,
-            schema=schema,
+def prefetch_tables(engine: sa.engine.Engine, data_sources: Iterable[DataSource]):
+    """Reflect the tables of all ``TableDataSource``s in ``data_sources`` at once.
+
+    Reflecting all tables of a schema in bulk requires a constant number of
+    queries, whereas reflecting the tables one by one on first use requires
+    several queries per table.
+    """
+    table_names_by_schema: dict[str | None, set[str]] = defaultdict(set)
+    for data_source in data_sources:
+        if isinstance(data_source, TableDataSource):
+            schema = data_source.get_schema(engine)
+            table_names_by_schema[schema].add(data_source.table_name)
+
+    metadata = get_metadata()
+    with _metadata_lock:
+        for schema, table_names in table_names_by_schema.items():
+            missing_table_names = {
+                table_name
+                for table_name in table_names
+                if (f"{schema}.{table_name}" if schema else table_name)
+                not in metadata.tables
+            }
+            if not missing_table_names:
+                continue
+            try:
+                metadata.reflect(
+                    bind=engine,
+                    schema=schema,
+                    views=True,
+                    only=lambda table_name, _: table_name in missing_table_names,
+                )
+            except sa.exc.SQLAlchemyError:
+                # Tables which could not be prefetched are reflected on first use,
+                # which yields a more specific error if they are inaccessible.
+                pass
+
+
+def _get_table_metadata(
+    engine: sa.engine.Engine, data_source: TableDataSource
+) -> _TableMetadata:
+    key = (
+        str(engine.url),
+        data_source.db_name,
+        data_source.schema_name,
+        data_source.table_name,
+    )
+    if (table_metadata := _table_metadata_cache.get(key)) is None:
+        table = data_source.get_clause(engine)
+        table_metadata = _TableMetadata(
+            column_names=tuple(column.name for column in table.columns),
+            primary_keys=tuple(column.name for column in table.primary_key.columns),
+            column_types={column.name: column.type for column in table.columns},
         )
+        _table_metadata_cache[key] = table_metadata
+    return table_metadata
 
 
 @final
@@ -320,11 +459,8 @@ class DataReference:
             )
         else:
             selection = sa.select(clause)
-        if self.condition is not None:
-            text = str(self.condition)
-            if is_snowflake(engine):
-                text = self.condition.snowflake_str()
-            selection = selection.where(sa.text(text))
+        if (condition_clause := self.get_condition_clause(engine)) is not None:
+            selection = selection.where(condition_clause)
         if is_mssql(engine) and isinstance(self.data_source, TableDataSource):
             # Allow dirty reads when using MSSQL.
             # When using an ExpressionDataSource or StringDataSource, the user is
@@ -334,6 +470,13 @@ class DataReference:
             selection = selection.with_hint(clause, "WITH (NOLOCK)")
         return selection
 
+    def get_condition_clause(self, engine: sa.engine.Engine) -> sa.TextClause | None:
+        if self.condition is None:
+            return None
+        if is_snowflake(engine):
+            return sa.text(self.condition.snowflake_str())
+        return sa.text(str(self.condition))
+
     def get_column(self, engine):
         """Fetch the only relevant column of a DataReference."""
         if self.columns is None:
@@ -363,7 +506,7 @@ class DataReference:
         return (
             self.columns
             if self.columns is not None
-            else get_primary_keys(engine, self.data_source)
+            else get_primary_keys(engine, self)[0]
         )
 
     def get_column_selection_string(self):
@@ -451,7 +594,8 @@ def get_date_span(engine, ref, date_column_name):
             "Date spans not yet implemented for this sql dialect."
         )
 
-    date_span = engine.connect().execute(selection).scalar()
+    with connect(engine) as connection:
+        date_span = connection.execute(selection).scalar()
     if date_span < 0:
         raise ValueError(
             f"Date span has negative value: {date_span}. It must be positive."
@@ -491,6 +635,10 @@ def get_interval_overlaps_nd(
             f"end_columns has dimensionality {len(end_columns)}."
         )
     dimensionality = len(start_columns)
+    if key_columns and dimensionality == 1:
+        return _get_interval_overlaps_1d(
+            engine, ref, key_columns, start_columns[0], end_columns[0], end_included
+        )
     table1 = ref.get_selection(engine).alias()
     table2 = ref.get_selection(engine).alias()
 
@@ -544,18 +692,124 @@ def get_interval_overlaps_nd(
     #     violation_subquery
     # )
 
-    violation_subquery = violation_selection.subquery()
+    # The sample and the count of violations are both derived from the same CTE,
+    # s.t. the violations only need to be computed once when queried together.
+    violations = violation_selection.cte()
 
     keys = (
-        get_table_columns(violation_subquery, key_columns)
+        get_table_columns(violations, key_columns)
         if key_columns
-        else violation_subquery.columns
+        else violations.columns
     )
     violation_subquery = sa.select(*keys).group_by(*keys).subquery()
 
     n_violations_selection = sa.select(sa.func.count()).select_from(violation_subquery)
 
-    return violation_selection, n_violations_selection
+    return sa.select(violations), n_violations_selection
+
+
+def _get_interval_overlaps_1d(
+    engine: sa.engine.Engine,
+    ref: DataReference,
+    key_columns: list[str],
+    start_column: str,
+    end_column: str,
+    end_included: bool,
+):
+    """Find overlapping intervals per key by sweeping over the intervals by start.
+
+    An interval overlaps with another one with a smaller start if and only if its
+    start is smaller than, or equal to if ``end_included``, the maximal end of all
+    intervals with a smaller start. In contrast to joining the intervals with each
+    other, this only requires sorting them.
+    """
+    table = ref.get_selection(engine).alias()
+    table_key_columns = get_table_columns(table, key_columns)
+    # Intervals with the same start don't overlap with each other, hence only the
+    # maximal end per start is relevant. As in a join on the keys and starts, rows
+    # with a NULL key or start are never part of an overlap. A NULL end is ignored
+    # by ``max``, matching a comparison with it never holding.
+    intervals = (
+        sa.select(
+            *table_key_columns,
+            table.c[start_column],
+            sa.func.max(table.c[end_column]).label(end_column),
+        )
+        .where(
+            *[column.is_not(None) for column in table_key_columns],
+            table.c[start_column].is_not(None),
+        )
+        .group_by(*table_key_columns, table.c[start_column])
+        .subquery()
+    )
+    preceding_end = (
+        sa.func.max(intervals.c[end_column])
+        .over(
+            partition_by=get_table_columns(intervals, key_columns),
+            order_by=intervals.c[start_column],
+            rows=(None, -1),
+        )
+        .label("preceding_end")
+    )
+    swept_intervals = sa.select(*intervals.columns, preceding_end).subquery()
+
+    end_operator = operator.ge if end_included else operator.gt
+    violations = (
+        sa.select(swept_intervals)
+        .where(
+            end_operator(
+                swept_intervals.c["preceding_end"], swept_intervals.c[start_column]
+            )
+        )
+        .cte()
+    )
+
+    keys = get_table_columns(violations, key_columns)
+    violation_subquery = sa.select(*keys).group_by(*keys).subquery()
+
+    n_violations_selection = sa.select(sa.func.count()).select_from(violation_subquery)
+
+    return sa.select(violations), n_violations_selection
+
+
+def get_sample(
+    engine: sa.engine.Engine, selection: sa.Select
+) -> tuple[sa.Row | None, list[sa.Select]]:
+    """Fetch a single row of ``selection`` or ``None`` if it is empty."""
+    selection = selection.limit(1)
+    with connect(engine) as connection:
+        result = connection.execute(selection).first()
+    return result, [selection]
+
+
+def get_interval_violations(
+    engine: sa.engine.Engine,
+    sample_selection: sa.Select,
+    n_violations_selection: sa.Select,
+    keys_ref: DataReference,
+) -> tuple[tuple[int, int], tuple | None, list[sa.Select]]:
+    """Count the keys with violations and all distinct keys and fetch a sample violation.
+
+    All three are retrieved in a single query. The sample is ``None`` if there are no
+    violations.
+    """
+    n_violations = n_violations_selection.subquery()
+    n_keys = get_unique_count_selection(engine, keys_ref).subquery()
+    sample = sample_selection.limit(1).subquery()
+    selection = sa.select(*n_violations.columns, *n_keys.columns, *sample.columns)
+    selection = selection.select_from(
+        n_violations.join(n_keys, sa.true()).outerjoin(sample, sa.true())
+    )
+    with connect(engine) as connection:
+        n_violation_keys, n_distinct_key_values, *sample_row = connection.execute(
+            selection
+        ).one()
+    n_violation_keys = int(n_violation_keys)
+    return (
+        (n_violation_keys, int(n_distinct_key_values)),
+        tuple(sample_row) if n_violation_keys else None,
+        [selection],
+    )
 
 
 def _not_in_interval_condition(
@@ -669,9 +923,10 @@ def _get_interval_gaps(
         end_table.c[end_column],
     ).select_from(start_table.join(end_table, join_condition))
 
-    violation_subquery = violation_selection.subquery()
+    # See get_interval_overlaps_nd.
+    violations = violation_selection.cte()
 
-    keys = get_table_columns(violation_subquery, key_columns)
+    keys = get_table_columns(violations, key_columns)
 
     grouped_violation_subquery = sa.select(*keys).group_by(*keys).subquery()
 
@@ -679,7 +934,7 @@ def _get_interval_gaps(
         grouped_violation_subquery
     )
 
-    return violation_selection, n_violations_selection
+    return sa.select(violations), n_violations_selection
 
 
 def _date_gap_condition(
@@ -817,7 +1072,8 @@ def get_functional_dependency_violations(
         uniques.join(violations_stmt, join_condition)
     )
 
-    result = engine.connect().execute(violation_tuples).fetchall()
+    with connect(engine) as connection:
+        result = connection.execute(violation_tuples).fetchall()
     return result, [violation_tuples]
 
 
@@ -828,13 +1084,30 @@ def get_row_count(
 
     If `row_limit` is given, the number of rows is capped at the limit.
     """
+    selection = _get_row_count_selection(engine, ref, row_limit)
+    with connect(engine) as connection:
+        result = int(connection.execute(selection).scalar_one())
+    return result, [selection]
+
+
+def get_row_counts(engine, ref, ref2) -> tuple[tuple[int, int], list[sa.Select]]:
+    """Return the number of rows for two `DataReference`s in a single query."""
+    row_count1 = _get_row_count_selection(engine, ref).subquery()
+    row_count2 = _get_row_count_selection(engine, ref2).subquery()
+    selection = sa.select(*row_count1.columns, *row_count2.columns).select_from(
+        row_count1.join(row_count2, sa.true())
+    )
+    with connect(engine) as connection:
+        n_rows1, n_rows2 = connection.execute(selection).one()
+    return (int(n_rows1), int(n_rows2)), [selection]
+
+
+def _get_row_count_selection(engine, ref, row_limit: int | None = None) -> sa.Select:
     subquery = ref.get_selection(engine)
     if row_limit:
         subquery = subquery.limit(row_limit)
     subquery = subquery.alias()
-    selection = sa.select(sa.cast(sa.func.count(), sa.BigInteger)).select_from(subquery)
-    result = int(str(engine.connect().execute(selection).scalar()))
-    return result, [selection]
+    return sa.select(sa.cast(sa.func.count(), sa.BigInteger)).select_from(subquery)
 
 
 def get_column(
@@ -855,11 +1128,13 @@ def get_column(
 
     if not aggregate_operator:
         selection = sa.select(column)
-        result = engine.connect().execute(selection).scalars().all()
+        with connect(engine) as connection:
+            result = connection.execute(selection).scalars().all()
 
     else:
         selection = sa.select(aggregate_operator(column))
-        result = engine.connect().execute(selection).scalar()
+        with connect(engine) as connection:
+            result = connection.execute(selection).scalar()
 
     return result, [selection]
 
@@ -874,13 +1149,55 @@ def get_max(engine, ref):
     return get_column(engine, ref, aggregate_operator=column_operator)
 
 
-def get_mean(engine, ref):
+def _get_mean_operator(engine):
     def column_operator(column):
         if is_impala(engine):
             return sa.func.avg(column)
         return sa.func.avg(sa.cast(column, sa.DECIMAL))
 
-    return get_column(engine, ref, aggregate_operator=column_operator)
+    return column_operator
+
+
+def get_mean(engine, ref):
+    return get_column(engine, ref, aggregate_operator=_get_mean_operator(engine))
+
+
+def shares_data_source(engine, ref, ref2) -> bool:
+    """Check whether two DataReferences can be evaluated on one common selection."""
+    if ref.data_source is ref2.data_source:
+        return True
+    # Reflected tables are shared via the common ``MetaData``.
+    return isinstance(ref.data_source, TableDataSource) and (
+        ref.data_source.get_clause(engine) is ref2.data_source.get_clause(engine)
+    )
+
+
+def get_means(engine, ref, ref2):
+    """Compute the means of two DataReferences on the same DataSource at once.
+
+    Rather than filtering with a where clause per DataReference, each condition is
+    applied within the respective aggregate, s.t. the data is only scanned once.
+    """
+    # Select from the data source's clause directly, as in ``get_selection``, s.t.
+    # conditions referring to it by name still resolve.
+    clause = ref.data_source.get_clause(engine)
+    column_operator = _get_mean_operator(engine)
+
+    def aggregate(data_reference):
+        column = clause.c[data_reference.get_column(engine)]
+        if (
+            condition_clause := data_reference.get_condition_clause(engine)
+        ) is not None:
+            column = sa.case((condition_clause, column))
+        return column_operator(column)
+
+    selection = sa.select(aggregate(ref), aggregate(ref2)).select_from(clause)
+    if is_mssql(engine) and isinstance(ref.data_source, TableDataSource):
+        # Allow dirty reads when using MSSQL, see ``DataReference.get_selection``.
+        selection = selection.with_hint(clause, "WITH (NOLOCK)")
+    with connect(engine) as connection:
+        result = connection.execute(selection).fetchone()
+    return (result[0], result[1]), [selection]
 
 
 def get_percentile(engine, ref, percentage):
@@ -921,7 +1238,8 @@ def get_percentile(engine, ref, percentage):
     percentile_selection = sa.select(counting_subquery.c[column_name]).where(
         counting_subquery.c[row_num] == argmin_selection
     )
-    result = engine.connect().execute(percentile_selection).scalar()
+    with connect(engine) as connection:
+        result = connection.execute(percentile_selection).scalar()
     return result, [percentile_selection]
 
 
@@ -958,6 +1276,18 @@ def get_fraction_between(engine, ref, lower_bound, upper_bound):
     return (n_filtered / n_all) if n_all > 0 else None, selections
 
 
+# Number of rows fetched at once when processing a result row by row.
+_STREAM_BATCH_SIZE = 10_000
+
+
+def _stream_rows(engine: sa.engine.Engine, selection: sa.Select) -> Iterator[sa.Row]:
+    """Iterate over the rows of a selection without fetching all of them at once."""
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(selection)
+        for partition in result.partitions(_STREAM_BATCH_SIZE):
+            yield from partition
+
+
 def get_uniques(
     engine: sa.engine.Engine, ref: DataReference
 ) -> tuple[Counter, list[sa.Select]]:
@@ -981,28 +1311,78 @@ def get_uniques(
         unique_from_row = _scalar_accessor
 
     result = Counter(
-        {
-            unique_from_row(row): row[-1]
-            for row in engine.connect().execute(selection).fetchall()
-        }
+        {unique_from_row(row): row[-1] for row in _stream_rows(engine, selection)}
     )
     return result, [selection]
 
 
+def has_uniques_difference(
+    engine: sa.engine.Engine,
+    ref: DataReference,
+    ref2: DataReference,
+    null_filter: Callable[[list[sa.ColumnElement]], sa.ColumnElement] | None = None,
+) -> tuple[bool, list[sa.Select]]:
+    """Check whether the unique values of two DataReferences differ.
+
+    Rather than fetching the unique values of both DataReferences, their symmetric
+    difference is computed by the database and only probed for a single row.
+    ``null_filter`` allows for excluding rows based on the respective columns.
+    """
+
+    def get_uniques_selection(data_reference):
+        subquery = data_reference.get_selection(engine).alias()
+        if (column_names := data_reference.get_columns(engine)) is None:
+            raise ValueError("Need columns for has_uniques_difference.")
+        columns = [subquery.c[column_name] for column_name in column_names]
+        selection = sa.select(*columns)
+        if null_filter is not None:
+            selection = selection.where(null_filter(columns))
+        return selection
+
+    selection1 = get_uniques_selection(ref)
+    selection2 = get_uniques_selection(ref2)
+    difference = sa.union_all(
+        sa.except_(selection1, selection2), sa.except_(selection2, selection1)
+    ).subquery()
+    selection = sa.select(sa.literal(1)).select_from(difference).limit(1)
+    # Not using a shared connection: callers recover from this query failing,
+    # which would leave a shared transaction aborted.
+    with engine.connect() as connection:
+        result = connection.execute(selection).first()
+    return result is not None, [selection]
+
+
+def get_unique_count_selection(engine, ref) -> sa.Select:
+    subquery = ref.get_selection(engine).distinct().alias()
+    return sa.select(sa.func.count()).select_from(subquery)
+
+
 def get_unique_count(engine, ref) -> tuple[int, list[sa.Select]]:
-    selection = ref.get_selection(engine)
-    subquery = selection.distinct().alias()
-    selection = sa.select(sa.func.count()).select_from(subquery)
-    result = int(engine.connect().execute(selection).scalar())
+    selection = get_unique_count_selection(engine, ref)
+    with connect(engine) as connection:
+        result = int(connection.execute(selection).scalar())
     return result, [selection]
 
 
+def get_row_and_unique_counts(engine, ref) -> tuple[tuple[int, int], list[sa.Select]]:
+    """Count the rows and the unique rows of a `DataReference` in a single query."""
+    row_count = _get_row_count_selection(engine, ref).subquery()
+    unique_count = get_unique_count_selection(engine, ref).subquery()
+    selection = sa.select(*row_count.columns, *unique_count.columns).select_from(
+        row_count.join(unique_count, sa.true())
+    )
+    with connect(engine) as connection:
+        n_rows, n_unique_rows = connection.execute(selection).one()
+    return (int(n_rows), int(n_unique_rows)), [selection]
+
+
 def get_unique_count_union(engine, ref, ref2):
     selection1 = ref.get_selection(engine)
     selection2 = ref2.get_selection(engine)
     subquery = sa.sql.union(selection1, selection2).alias().select().distinct().alias()
     selection = sa.select(sa.func.count()).select_from(subquery)
-    result = engine.connect().execute(selection).scalar()
+    with connect(engine) as connection:
+        result = connection.execute(selection).scalar()
     return result, [selection]
 
 
@@ -1014,7 +1394,7 @@ def get_missing_fraction(engine, ref):
         .select_from(selection)
         .where(selection.c[ref.get_column(engine)].is_(None))
     )
-    with engine.connect() as connection:
+    with connect(engine) as connection:
         n_rows_total = connection.execute(n_rows_total_selection).scalar()
         n_rows_missing = connection.execute(n_rows_missing_selection).scalar()
 
@@ -1025,17 +1405,36 @@ def get_missing_fraction(engine, ref):
 
 
 def get_column_names(engine, ref):
+    if isinstance(ref.data_source, TableDataSource):
+        table_metadata = _get_table_metadata(engine, ref.data_source)
+        return list(table_metadata.column_names), None
     table = ref.data_source.get_clause(engine)
     return [column.name for column in table.columns], None
 
 
 def get_column_type(engine, ref):
-    table = ref.get_selection(engine).alias()
-    column_type = next(iter(table.columns)).type
-    return column_type, None
+    if isinstance(ref.data_source, TableDataSource):
+        table_metadata = _get_table_metadata(engine, ref.data_source)
+        column_name = (
+            ref.get_columns(engine)[0]
+            if ref.columns
+            else table_metadata.column_names[0]
+        )
+        return table_metadata.column_types[column_name], None
+    # The type is read from the data source's columns directly, rather than
+    # from a selection built around them.
+    clause = ref.data_source.get_clause(engine)
+    if ref.columns:
+        column = clause.c[ref.get_columns(engine)[0]]
+    else:
+        column = next(iter(clause.columns))
+    return column.type, None
 
 
 def get_primary_keys(engine, ref):
+    if isinstance(ref.data_source, TableDataSource):
+        table_metadata = _get_table_metadata(engine, ref.data_source)
+        return list(table_metadata.primary_keys), None
     table = ref.data_source.get_clause(engine)
     return [column.name for column in table.primary_key.columns], None
 
@@ -1044,7 +1443,8 @@ def get_row_difference_sample(engine, ref, ref2):
     selection1 = ref.get_selection(engine)
     selection2 = ref2.get_selection(engine)
     selection = sa.sql.except_(selection1, selection2).alias().select()
-    result = engine.connect().execute(selection).first()
+    with connect(engine) as connection:
+        result = connection.execute(selection).first()
     return result, [selection]
 
 
@@ -1055,7 +1455,8 @@ def get_row_difference_count(engine, ref, ref2):
         sa.sql.except_(selection1, selection2).alias().select().distinct().alias()
     )
     selection = sa.select(sa.func.count()).select_from(subquery)
-    result = engine.connect().execute(selection).scalar()
+    with connect(engine) as connection:
+        result = connection.execute(selection).scalar()
     return result, [selection]
 
 
@@ -1097,8 +1498,9 @@ def get_row_mismatch(engine, ref, ref2, match_and_compare):
     selection_n_rows = sa.select(sa.func.count()).select_from(
         subselection1.join(subselection2, match)
     )
-    result_mismatch = engine.connect().execute(selection_difference).scalar()
-    result_n_rows = engine.connect().execute(selection_n_rows).scalar()
+    with connect(engine) as connection:
+        result_mismatch = connection.execute(selection_difference).scalar()
+        result_n_rows = connection.execute(selection_n_rows).scalar()
     return result_mismatch, result_n_rows, [selection_difference, selection_n_rows]
 
 
@@ -1120,44 +1522,61 @@ def get_duplicate_sample(engine, ref):
         )
         .select_from(aggregate_subquery)
         .where(aggregate_subquery.c.n_copies > 1)
+        .limit(1)
     )
-    result = engine.connect().execute(duplicate_selection).first()
+    with connect(engine) as connection:
+        result = connection.execute(duplicate_selection).first()
     return result, [duplicate_selection]
 
 
-def column_array_agg_query(
-    engine: sa.engine.Engine, ref: DataReference, aggregation_column: str
-):
-    clause = ref.data_source.get_clause(engine)
-    if not (column_names := ref.get_columns(engine)):
-        raise ValueError("There must be a column to group by")
-    group_columns = [clause.c[column] for column in column_names]
-    agg_column = clause.c[aggregation_column]
-    selection = sa.select(*group_columns, sa.func.array_agg(agg_column)).group_by(
-        *group_columns
-    )
-    return [selection]
-
-
 def snowflake_parse_variant_column(value: str):
     # Snowflake returns non-primitive columns such as arrays as JSON string,
     # but we want them in their deserialized form.
     return json.loads(value)
 
 
-def get_column_array_agg(
-    engine: sa.engine.Engine, ref: DataReference, aggregation_column: str
+def get_missing_from_range(
+    engine: sa.engine.Engine,
+    ref: DataReference,
+    aggregation_column: str,
+    start_value: int,
 ):
-    selections = column_array_agg_query(engine, ref, aggregation_column)
-    result: Sequence[sa.engine.row.Row[Any]] | list[tuple[Any, ...]] = (
-        engine.connect().execute(selections[0]).fetchall()
+    """Count the integers missing from the values of ``aggregation_column`` per group.
+
+    The expected integers of a group range from ``start_value`` over as many integers
+    as the group's maximal value. The values themselves are only aggregated via
+    ``array_agg`` for groups with missing integers.
+    """
+    clause = ref.data_source.get_clause(engine)
+    if not (column_names := ref.get_columns(engine)):
+        raise ValueError("There must be a column to group by")
+    group_columns = [clause.c[column] for column in column_names]
+    agg_column = clause.c[aggregation_column]
+    subquery = sa.select(
+        *group_columns,
+        agg_column,
+        sa.func.max(agg_column).over(partition_by=group_columns),
+    ).subquery()
+    *group_columns, value, max_value = subquery.columns
+
+    in_range = sa.and_(value >= start_value, value < max_value + start_value)
+    n_missing = sa.func.max(max_value) - sa.func.count(
+        sa.distinct(sa.case((in_range, value)))
     )
-    if is_snowflake(engine):
-        result = [
-            (*t[:-1], list(map(int, snowflake_parse_variant_column(t[-1]))))
-            for t in result
-        ]
-    return result, selections
+    selection = sa.select(
+        *group_columns,
+        n_missing,
+        sa.case((n_missing > 0, sa.func.array_agg(value))),
+    ).group_by(*group_columns)
+    with connect(engine) as connection:
+        rows = connection.execute(selection).fetchall()
+
+    result = {}
+    for *key, n_missing_values, values in rows:
+        if values is not None and is_snowflake(engine):
+            values = list(map(int, snowflake_parse_variant_column(values)))
+        result[tuple(key)] = (n_missing_values, values)
+    return result, [selection]
 
 
 def _cdf_selection(engine, ref: DataReference, cdf_label: str, value_label: str):
@@ -1203,72 +1622,49 @@ def _cross_cdf_selection(
     """
     cdf_label1 = cdf_label + "1"
     cdf_label2 = cdf_label + "2"
-    group_label1 = "_grp1"
-    group_label2 = "_grp2"
 
     cdf_selection1 = _cdf_selection(engine, ref1, cdf_label, value_label)
     cdf_selection2 = _cdf_selection(engine, ref2, cdf_label, value_label)
 
-    # Step 3: Combine the cdfs.
-    cross_cdf = (
+    # Step 3: Stack both cdfs on top of each other. Every row carries the cdf
+    # value of its own sample and 0 for the other sample.
+    stacked_cdf = sa.union_all(
         sa.select(
-            sa.func.coalesce(
-                cdf_selection1.c[value_label], cdf_selection2.c[value_label]
-            ).label(value_label),
+            cdf_selection1.c[value_label].label(value_label),
             cdf_selection1.c[cdf_label].label(cdf_label1),
+            sa.literal_column("0").label(cdf_label2),
+        ),
+        sa.select(
+            cdf_selection2.c[value_label].label(value_label),
+            sa.literal_column("0").label(cdf_label1),
             cdf_selection2.c[cdf_label].label(cdf_label2),
+        ),
+    ).subquery()
+
+    # Step 4: Aggregate rows s.t. every value of either sample occurs only once.
+    cross_cdf = (
+        sa.select(
+            stacked_cdf.c[value_label],
+            sa.func.max(stacked_cdf.c[cdf_label1]).label(cdf_label1),
+            sa.func.max(stacked_cdf.c[cdf_label2]).label(cdf_label2),
         )
-        .select_from(
-            cdf_selection1.join(
-                cdf_selection2,
-                cdf_selection1.c[value_label] == cdf_selection2.c[value_label],
-                isouter=True,
-                full=True,
-            )
-        )
+        .group_by(stacked_cdf.c[value_label])
         .subquery()
     )
 
-    def _cdf_index_column(table, value_label, cdf_label, group_label):
+    def _forward_filled_cdf_column(table, cdf_label, value_label):
+        # Step 5: Forward-Filling: Since a cdf is monotonically increasing, its value
+        # at a value only present in the other sample is the running maximum.
         return (
-            sa.func.count(table.c[cdf_label])
-            .over(order_by=table.c[value_label])
-            .label(group_label)
-        )
-
-    # Step 4: Create a grouper id based on the value count; this is just a helper for forward-filling.
-    # In other words, we point rows to their most recent present value - per sample. This is necessary
-    # Due to the nature of the full outer join.
-    indexed_cross_cdf = sa.select(
-        cross_cdf.c[value_label],
-        _cdf_index_column(cross_cdf, value_label, cdf_label1, group_label1),
-        cross_cdf.c[cdf_label1],
-        _cdf_index_column(cross_cdf, value_label, cdf_label2, group_label2),
-        cross_cdf.c[cdf_label2],
-    ).subquery()
-
-    def _forward_filled_cdf_column(table, cdf_label, value_label, group_label):
-        return (
-            # Step 6: Replace NULL values at the beginning with 0 to enable computation of difference.
-            sa.func.coalesce(
-                (
-                    # Step 5: Forward-Filling: Select first non-NULL value per group (defined in the prev. step).
-                    sa.func.first_value(table.c[cdf_label]).over(
-                        partition_by=table.c[group_label], order_by=table.c[value_label]
-                    )
-                ),
-                0,
-            ).label(cdf_label)
+            sa.func.max(table.c[cdf_label])
+            .over(order_by=table.c[value_label], rows=(None, 0))
+            .label(cdf_label)
         )
 
     filled_cross_cdf = sa.select(
-        indexed_cross_cdf.c[value_label],
-        _forward_filled_cdf_column(
-            indexed_cross_cdf, cdf_label1, value_label, group_label1
-        ),
-        _forward_filled_cdf_column(
-            indexed_cross_cdf, cdf_label2, value_label, group_label2
-        ),
+        cross_cdf.c[value_label],
+        _forward_filled_cdf_column(cross_cdf, cdf_label1, value_label),
+        _forward_filled_cdf_column(cross_cdf, cdf_label2, value_label),
     )
     return filled_cross_cdf, cdf_label1, cdf_label2
 
@@ -1279,7 +1675,8 @@ def get_ks_2sample(
     ref2: DataReference,
 ):
     """
-    Run the query for the two-sample Kolmogorov-Smirnov test and return the test statistic d.
+    Run the query for the two-sample Kolmogorov-Smirnov test and return the test
+    statistic d as well as both sample sizes.
 
     For a raw-sql version of this query, please see this PR:
     https://github.com/Quantco/datajudge/pull/28/
@@ -1292,17 +1689,38 @@ def get_ks_2sample(
 
     filled_cross_cdf = filled_cross_cdf_selection.subquery()
 
-    # Step 7: Calculate final statistic: maximal distance.
-    final_selection = sa.select(
+    # Step 6: Calculate final statistic: maximal distance.
+    d_statistic_selection = sa.select(
         sa.func.max(
             sa.func.abs(filled_cross_cdf.c[cdf_label1] - filled_cross_cdf.c[cdf_label2])
+        ).label("d_statistic")
+    ).subquery()
+
+    # Step 7: Retrieve the sample sizes along with the statistic, s.t. a single
+    # round trip to the database suffices.
+    def _n_samples_selection(ref):
+        return (
+            sa.select(sa.cast(sa.func.count(), sa.BigInteger).label("n_samples"))
+            .select_from(ref.get_selection(engine).alias())
+            .subquery()
+        )
+
+    n_samples_selection1 = _n_samples_selection(ref1)
+    n_samples_selection2 = _n_samples_selection(ref2)
+    final_selection = sa.select(
+        d_statistic_selection.c.d_statistic,
+        n_samples_selection1.c.n_samples,
+        n_samples_selection2.c.n_samples,
+    ).select_from(
+        d_statistic_selection.join(n_samples_selection1, sa.true()).join(
+            n_samples_selection2, sa.true()
         )
     )
 
-    with engine.connect() as connection:
-        d_statistic = connection.execute(final_selection).scalar()
+    with connect(engine) as connection:
+        d_statistic, n_samples, m_samples = connection.execute(final_selection).one()
 
-    return d_statistic, [final_selection]
+    return (d_statistic, int(n_samples), int(m_samples)), [final_selection]
 
 
 def get_regex_violations(engine, ref, aggregated, regex, n_counterexamples):
@@ -1337,7 +1755,7 @@ def get_regex_violations(engine, ref, aggregated, regex, n_counterexamples):
     if counterexamples_selection is not None:
         selections.append(counterexamples_selection)
 
-    with engine.connect() as connection:
+    with connect(engine) as connection:
         n_violations_result = connection.execute(n_violations_selection).scalar()
         if counterexamples_selection is None:
             counterexamples = []
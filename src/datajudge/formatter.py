@@ -16,6 +16,9 @@ class Formatter(abc.ABC):
         return inner
 
     def fmt_str(self, string: str) -> str:
+        # Most strings don't contain any styling codes, skip the regex for those.
+        if "[/num" not in string:
+            return string
         # Replace codes with platform specific styling
         string = self.known_bb_pattern.sub(
             lambda m: self.apply_formatting(m.group(1), m.group(2)), string
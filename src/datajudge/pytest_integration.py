@@ -1,12 +1,14 @@
-from typing import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Set
 
 import pytest
+import sqlalchemy as sa
 from packaging.version import Version
 
-from .constraints.base import Constraint
-from .db_access import apply_patches
+from .constraints.base import Constraint, TestResult
+from .db_access import apply_patches, prefetch_tables
 from .formatter import AnsiColorFormatter, Formatter
-from .requirements import Requirement
+from .requirements import Requirement, _test_constraint
 
 
 def get_formatter(pytestconfig):
@@ -32,25 +34,86 @@ def get_formatter(pytestconfig):
         return Formatter()
 
 
-def collect_data_tests(requirements: Iterable[Requirement]):
+def collect_data_tests(
+    requirements: Iterable[Requirement], max_workers: Optional[int] = None
+):
     """Make a Pytest test case that checks all `requirements`.
 
     Returns a function named `test_constraint` that is parametrized over all
     constraints in `requirements`. The function requires a `datajudge_engine`
     fixture that is a SQLAlchemy engine to be available.
+
+    If `max_workers` is given, the constraints of all selected test cases are
+    submitted to a thread pool of that size as soon as the first test case runs,
+    such that the queries of independent constraints are executed concurrently.
+    Each test case then only waits for the result of its own constraint. Pending
+    constraints are cancelled once the session ends, e.g. after ``-x``. The
+    connection pool of the engine should allow for at least `max_workers`
+    connections, e.g. by creating it with
+    ``sa.create_engine(..., pool_size=max_workers, max_overflow=0)``.
     """
     all_constraints = [
         constraint for requirement in requirements for constraint in requirement
     ]
+    data_sources = [
+        ref.data_source
+        for constraint in all_constraints
+        for ref in (constraint.ref, constraint.ref2)
+        if ref is not None
+    ]
+    prefetched_engines: Set[sa.engine.Engine] = set()
+    futures: Dict[sa.engine.Engine, Dict[Constraint, Future]] = {}
+
+    def submit_collected_constraints(
+        engine: sa.engine.Engine, session: pytest.Session
+    ) -> Dict[Constraint, Future]:
+        # Only submit the constraints of test cases which are actually run, e.g. not
+        # those deselected via ``-k``.
+        selected_constraints = {
+            item.callspec.params["constraint"]
+            for item in session.items
+            if isinstance(item, pytest.Function) and item.function is test_constraint
+        }
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        engine_futures = {
+            c: executor.submit(_test_constraint, c, engine)
+            for c in all_constraints
+            if c in selected_constraints
+        }
+        # Already submitted tasks keep running after a non-waiting shutdown.
+        executor.shutdown(wait=False)
+
+        def cancel_pending():
+            # Don't wait for constraints whose test cases won't run anymore, e.g.
+            # after ``-x`` stopped the session.
+            for future in engine_futures.values():
+                future.cancel()
+
+        session.config.add_cleanup(cancel_pending)
+        return engine_futures
+
+    def get_test_result(
+        constraint: Constraint, engine: sa.engine.Engine, session: pytest.Session
+    ) -> TestResult:
+        if engine not in prefetched_engines:
+            prefetch_tables(engine, data_sources)
+            prefetched_engines.add(engine)
+        if max_workers is None:
+            return _test_constraint(constraint, engine)
+        if engine not in futures:
+            futures[engine] = submit_collected_constraints(engine, session)
+        if (future := futures[engine].get(constraint)) is None:
+            return _test_constraint(constraint, engine)
+        return future.result()
 
     @pytest.mark.parametrize(
         "constraint", all_constraints, ids=Constraint.get_description
     )
-    def test_constraint(constraint, datajudge_engine, pytestconfig):
+    def test_constraint(constraint, datajudge_engine, pytestconfig, request):
         # apply patches that fix sqlalchemy issues
         formatter = get_formatter(pytestconfig)
         apply_patches(datajudge_engine)
-        test_result = constraint.test(datajudge_engine)
+        test_result = get_test_result(constraint, datajudge_engine, request.session)
         assert test_result.outcome, test_result.formatted_failure_message(formatter)
 
     return test_constraint
@@ -455,6 +455,48 @@ def integer_table_overlap(engine, metadata):
     return TEST_DB_NAME, SCHEMA, table_name
 
 
+@pytest.fixture(scope="module")
+def integer_table_overlap_edge_cases(engine, metadata):
+    table_name = "integer_table_overlap_edge_cases"
+    columns = [
+        sa.Column("id1", sa.Integer()),
+        sa.Column("range_start", sa.Integer()),
+        sa.Column("range_end", sa.Integer()),
+    ]
+    rows = [
+        # A NULL start doesn't overlap with anything.
+        (1, None, 100),
+        (1, 1, 2),
+        (1, 5, 6),
+        # A NULL end doesn't overlap with anything.
+        (2, 1, None),
+        (2, 3, 4),
+        # Entries with the same start don't overlap.
+        (3, 1, 5),
+        (3, 1, 3),
+        # Entries with the same start, one of which overlaps with a later entry.
+        (4, 1, 5),
+        (4, 1, 2),
+        (4, 3, 4),
+        # Entries touching each other, which only overlap if the end is included.
+        (5, 1, 3),
+        (5, 3, 5),
+        # An entry overlapping with a non-adjacent one.
+        (6, 1, 10),
+        (6, 2, 3),
+        (6, 5, 6),
+        # Entries with a NULL key don't overlap.
+        (None, 1, 5),
+        (None, 2, 3),
+    ]
+    data = [
+        {"id1": id1, "range_start": range_start, "range_end": range_end}
+        for id1, range_start, range_end in rows
+    ]
+    _handle_table(engine, metadata, table_name, columns, data)
+    return TEST_DB_NAME, SCHEMA, table_name
+
+
 @pytest.fixture(scope="module")
 def date_table_gap(engine, metadata):
     table_name = "date_table_gap"
@@ -717,6 +759,22 @@ def unique_table2(engine, metadata):
     return TEST_DB_NAME, SCHEMA, table_name
 
 
+@pytest.fixture(scope="module")
+def unique_table_trailing_blanks(engine, metadata):
+    table_name = "unique_table_trailing_blanks"
+    columns = [
+        sa.Column("col_int", sa.Integer()),
+        sa.Column("col_varchar", _string_column(engine)),
+    ]
+    data = [
+        {"col_int": 0, "col_varchar": "a"},
+        {"col_int": 1, "col_varchar": "a "},
+        {"col_int": 2, "col_varchar": "a"},
+    ]
+    _handle_table(engine, metadata, table_name, columns, data)
+    return TEST_DB_NAME, SCHEMA, table_name
+
+
 @pytest.fixture(scope="module")
 def unique_table_extralong(engine, metadata):
     if is_impala(engine):
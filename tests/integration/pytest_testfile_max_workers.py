@@ -0,0 +1,30 @@
+import pytest
+import sqlalchemy as sa
+
+from datajudge.constraints.base import Constraint, TestResult
+from datajudge.db_access import DataReference
+from datajudge.pytest_integration import collect_data_tests
+from datajudge.requirements import WithinRequirement
+
+example_req = WithinRequirement.from_raw_query("SELECT 1 AS a", "example")
+
+
+class RecordingTestConstraint(Constraint):
+    def test(self, engine: sa.engine.Engine) -> TestResult:
+        print(f"Tested {self.name}.")
+        return TestResult.success()
+
+
+@pytest.fixture()
+def datajudge_engine():
+    return sa.create_engine("sqlite://")
+
+
+for name in ["selected1", "deselected", "selected2"]:
+    example_req.append(
+        RecordingTestConstraint(
+            DataReference(example_req.data_source), ref_value=object(), name=name
+        )
+    )
+
+tests = collect_data_tests([example_req], max_workers=2)
@@ -6,8 +6,13 @@ from datajudge.db_access import (
     DataReference,
     ExpressionDataSource,
     RawQueryDataSource,
+    TableDataSource,
+    clear_metadata_cache,
     get_column_names,
+    get_column_type,
+    get_metadata,
     is_bigquery,
+    prefetch_tables,
 )
 
 
@@ -92,6 +97,68 @@ def test_get_column_names_expression(engine, metadata, int_table1, expression_ge
     assert set(factual_column_names) == {"col_int"}
 
 
+def test_get_column_names_table_cached(engine, int_table1):
+    db_name, schema_name, _ = int_table1
+    table_name = "altered_table"
+    data_ref = DataReference(TableDataSource(db_name, table_name, schema_name))
+
+    def create_table(*columns):
+        table = sa.Table(table_name, sa.MetaData(), *columns, schema=schema_name)
+        with engine.begin() as connection:
+            table.drop(connection, checkfirst=True)
+            table.create(connection)
+
+    create_table(sa.Column("col_int", sa.Integer()))
+    assert get_column_names(engine, data_ref)[0] == ["col_int"]
+
+    create_table(
+        sa.Column("col_int", sa.Integer()), sa.Column("col_int2", sa.Integer())
+    )
+    assert get_column_names(engine, data_ref)[0] == ["col_int"]
+    clear_metadata_cache()
+    assert get_column_names(engine, data_ref)[0] == ["col_int", "col_int2"]
+
+
+def test_get_column_type_table_cached(engine, int_table1):
+    db_name, schema_name, _ = int_table1
+    table_name = "retyped_table"
+    data_ref = DataReference(
+        TableDataSource(db_name, table_name, schema_name), columns=["col"]
+    )
+
+    def create_table(column_type):
+        table = sa.Table(
+            table_name, sa.MetaData(), sa.Column("col", column_type), schema=schema_name
+        )
+        with engine.begin() as connection:
+            table.drop(connection, checkfirst=True)
+            table.create(connection)
+
+    create_table(sa.Integer())
+    assert isinstance(get_column_type(engine, data_ref)[0], sa.Integer)
+
+    create_table(sa.String(10))
+    assert isinstance(get_column_type(engine, data_ref)[0], sa.Integer)
+    clear_metadata_cache()
+    assert isinstance(get_column_type(engine, data_ref)[0], sa.String)
+
+
+def test_prefetch_tables(engine, int_table1, int_table2):
+    clear_metadata_cache()
+    data_sources = [
+        TableDataSource(db_name, table_name, schema_name)
+        for db_name, schema_name, table_name in (int_table1, int_table2)
+    ]
+    prefetch_tables(engine, data_sources)
+    for data_source in data_sources:
+        assert (
+            f"{data_source.get_schema(engine)}.{data_source.table_name}"
+            in get_metadata().tables
+        )
+        data_ref = DataReference(data_source)
+        assert get_column_names(engine, data_ref)[0] == ["col_int"]
+
+
 def test_get_column_names_raw_query(engine, int_table1):
     _, schema_name, table_name = int_table1
     query = f"SELECT col_int FROM {schema_name}.{table_name}"
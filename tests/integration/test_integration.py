@@ -16,6 +16,7 @@ from datajudge.db_access import (
     is_mssql,
     is_postgresql,
     is_snowflake,
+    prefetch_tables,
 )
 from datajudge.utils import (
     filternull_element,
@@ -127,6 +128,17 @@ def test_n_rows_equality_between(engine, int_table1, int_table2, data):
     assert operation(req[0].test(engine).outcome)
 
 
+def test_n_rows_between_single_query(engine, int_table1, int_table2):
+    req = requirements.BetweenRequirement.from_tables(*int_table1, *int_table2)
+    req.add_n_rows_equality_constraint()
+    prefetch_tables(engine, [req[0].ref.data_source, req[0].ref2.data_source])
+    with QueryCollector() as query_collector:
+        test_result = req[0].test(engine)
+    assert len(query_collector) == 1, query_collector.queries
+    assert not test_result.outcome
+    assert "has 19 row(s) instead of" in test_result.failure_message
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -437,6 +449,59 @@ def test_uniques_equality_between(engine, unique_table1, unique_table2, data):
     assert operation(test_result.outcome), test_result.failure_message
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        (identity, "col_int = 0", "col_int = 2"),
+        (negation, "col_int = 0", "col_int = 1"),
+        (negation, "col_int = 1", "col_int = 2"),
+    ],
+)
+def test_uniques_equality_between_trailing_blanks(
+    engine, unique_table_trailing_blanks, data
+):
+    (operation, condition1, condition2) = data
+    req = requirements.BetweenRequirement.from_tables(
+        *unique_table_trailing_blanks, *unique_table_trailing_blanks
+    )
+    req.add_uniques_equality_constraint(
+        ["col_varchar"],
+        ["col_varchar"],
+        condition1=Condition(raw_string=condition1),
+        condition2=Condition(raw_string=condition2),
+    )
+    test_result = req[0].test(engine)
+    assert operation(test_result.outcome), test_result.failure_message
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        (identity, ["col_int"], filternull_element),
+        (negation, ["col_int"], filternull_never),
+        (identity, ["col_int"], filternull_element_or_tuple_all),
+        (identity, ["col_int"], filternull_element_or_tuple_any),
+        (negation, ["col_int", "col_varchar"], filternull_element),
+        (negation, ["col_int", "col_varchar"], filternull_never),
+        (negation, ["col_int", "col_varchar"], filternull_element_or_tuple_all),
+        (identity, ["col_int", "col_varchar"], filternull_element_or_tuple_any),
+    ],
+)
+def test_uniques_equality_between_filter_func(
+    engine, unique_table1, unique_table2, data
+):
+    (operation, columns, filter_func) = data
+    req = requirements.BetweenRequirement.from_tables(*unique_table1, *unique_table2)
+    req.add_uniques_equality_constraint(
+        columns,
+        columns,
+        filter_func=filter_func,
+        condition1=Condition(raw_string="col_int < 20 OR col_int IS NULL"),
+    )
+    test_result = req[0].test(engine)
+    assert operation(test_result.outcome), test_result.failure_message
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -1737,6 +1802,43 @@ def test_numeric_mean_between(engine, int_table1, int_table2, data):
     assert operation(test_result.outcome), test_result.failure_message
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        (identity, 0, None, None),
+        # The data at hand in int_table1 are [1, 2, ..., 19].
+        (identity, 5, None, Condition(raw_string="col_int > 10")),
+        (negation, 4.9, None, Condition(raw_string="col_int > 10")),
+        (
+            identity,
+            14,
+            Condition(raw_string="col_int <= 5"),
+            Condition(raw_string="col_int > 14"),
+        ),
+        # Conditions may refer to the table by name.
+        (
+            identity,
+            14,
+            Condition(raw_string="col_int <= 5"),
+            Condition(raw_string="int_table1.col_int > 14"),
+        ),
+        (negation, 1, Condition(raw_string="col_int > 100"), None),
+    ],
+)
+def test_numeric_mean_between_same_table(engine, int_table1, data):
+    (operation, max_absolute_deviation, condition1, condition2) = data
+    req = requirements.BetweenRequirement.from_tables(*int_table1, *int_table1)
+    req.add_numeric_mean_constraint(
+        "col_int",
+        "col_int",
+        max_absolute_deviation,
+        condition1=condition1,
+        condition2=condition2,
+    )
+    test_result = req[0].test(engine)
+    assert operation(test_result.outcome), test_result.failure_message
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -2053,6 +2155,38 @@ def test_integer_no_overlap_within_varying_key_columns(
     assert operation(test_result.outcome), test_result.failure_message
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        (identity, True, Condition(raw_string="id1 = 1")),
+        (identity, True, Condition(raw_string="id1 = 2")),
+        (identity, True, Condition(raw_string="id1 = 3")),
+        (negation, True, Condition(raw_string="id1 = 4")),
+        (negation, False, Condition(raw_string="id1 = 4")),
+        (negation, True, Condition(raw_string="id1 = 5")),
+        (identity, False, Condition(raw_string="id1 = 5")),
+        (negation, True, Condition(raw_string="id1 = 6")),
+        (negation, False, Condition(raw_string="id1 = 6")),
+        (identity, True, Condition(raw_string="id1 IS NULL")),
+    ],
+)
+def test_integer_no_overlap_within_edge_cases(
+    engine, integer_table_overlap_edge_cases, data
+):
+    operation, end_included, condition = data
+    req = requirements.WithinRequirement.from_table(*integer_table_overlap_edge_cases)
+    req.add_numeric_no_overlap_constraint(
+        key_columns=["id1"],
+        start_column="range_start",
+        end_column="range_end",
+        end_included=end_included,
+        max_relative_n_violations=0,
+        condition=condition,
+    )
+    test_result = req[0].test(engine)
+    assert operation(test_result.outcome), test_result.failure_message
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -2819,6 +2953,19 @@ def test_uniqueness_within_infer_pk(engine, data, mix_table2_pk):
     assert operation(test_result.outcome), test_result.failure_message
 
 
+def test_uniqueness_within_infer_pk_without_pk(engine, mix_table2):
+    if is_impala(engine):
+        pytest.skip("Primary key retrieval currently not implemented for impala.")
+    if is_bigquery(engine):
+        pytest.skip("No primary key concept in BigQuery")
+    req = requirements.WithinRequirement.from_table(*mix_table2)
+    req.add_uniqueness_constraint(columns=["col_int"], infer_pk_columns=True)
+    with pytest.warns(UserWarning, match="No primary keys found"):
+        test_result = req[0].test(engine)
+    assert req[0].ref.columns == ["col_int"]
+    assert test_result.outcome, test_result.failure_message
+
+
 @pytest.mark.parametrize(
     "data",
     [(identity, "int_table1", "col_int"), (negation, "unique_table1", "col_varchar")],
@@ -3129,6 +3276,30 @@ def test_groupby_aggregation_within_with_failures(
     assert operation(test_result.outcome), test_result.failure_message
 
 
+@pytest.mark.parametrize("start_value", [0, 1])
+def test_groupby_aggregation_within_missing_values(
+    engine, groupby_aggregation_table_incorrect, start_value
+):
+    skip_if_mssql(engine)
+    if is_db2(engine):
+        pytest.skip()
+    if is_impala(engine):
+        pytest.skip("array_agg does not exist for Impala.")
+    req = requirements.WithinRequirement.from_table(
+        *groupby_aggregation_table_incorrect
+    )
+    req.add_groupby_aggregation_constraint(["some_id"], "value", start_value)
+    test_result = req[0].test(engine)
+    assert not test_result.outcome
+    expected = {(44093821,): set(range(start_value, 16))}
+    if start_value == 0:
+        # With a start value of 0, the maximal value itself lies outside of the range.
+        expected.update({(34807101,): {0}, (42760071,): {0}})
+    for key, missing_values in expected.items():
+        assert f"{key}: {missing_values}" in test_result.failure_message
+    assert test_result.failure_message.count(": {") == len(expected)
+
+
 @pytest.mark.parametrize(
     "data",
     [
@@ -3255,3 +3426,22 @@ def test_ks_2sample_random(engine, random_normal_table, configuration):
     )
     test_result = req[0].test(engine)
     assert operation(test_result.outcome), test_result.failure_message
+
+
+def test_requirement_test_max_workers(engine, int_table1, int_table2):
+    def get_requirement():
+        req = requirements.BetweenRequirement.from_tables(*int_table1, *int_table2)
+        req.add_n_rows_equality_constraint()
+        req.add_n_rows_max_gain_constraint(constant_max_relative_gain=0.15)
+        req.add_numeric_max_constraint("col_int", "col_int")
+        req.add_numeric_min_constraint("col_int", "col_int")
+        return req
+
+    sequential_results = get_requirement().test(engine)
+    concurrent_results = get_requirement().test(engine, max_workers=4)
+    assert [result.outcome for result in concurrent_results] == [
+        result.outcome for result in sequential_results
+    ]
+    assert [result.failure_message for result in concurrent_results] == [
+        result.failure_message for result in sequential_results
+    ]
@@ -21,3 +21,20 @@ def test_formatter():
     assert "AssertionError: This is a stylized failure message" in output.stdout.decode(
         "utf-8"
     )
+
+
+def test_deselected_constraints_are_not_tested():
+    import os
+    import subprocess
+
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.run(
+        ["pytest", "-s", "pytest_testfile_max_workers.py", "-k", "not deselected"],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+    )
+    stdout = output.stdout.decode("utf-8")
+    assert output.returncode == 0
+    assert "Tested selected1." in stdout
+    assert "Tested selected2." in stdout
+    assert "Tested deselected." not in stdout
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from datajudge.db_access import Condition
@@ -35,6 +37,28 @@ def test_composite_str():
     assert str(c4) == f"({c1_str}) and ({c2_str}) and ({c3_str})"
 
 
+def test_str_cached():
+    c1 = Condition(raw_string="col1 = 1")
+    c2 = Condition(conditions=[c1, c1], reduction_operator="or")
+    assert str(c2) is str(c2)
+    assert c2 == Condition(conditions=[c1, c1], reduction_operator="or")
+    assert repr(c2) == (
+        "Condition(raw_string=None, conditions=[Condition(raw_string='col1 = 1', "
+        "conditions=None, reduction_operator=None), Condition(raw_string='col1 = 1', "
+        "conditions=None, reduction_operator=None)], reduction_operator='or')"
+    )
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10."
+)
+def test_slots():
+    c1 = Condition(raw_string="col1 = 1")
+    assert not hasattr(c1, "__dict__")
+    with pytest.raises(AttributeError):
+        c1.raw_string = "col1 = 2"  # type: ignore[misc]
+
+
 def test_nested_composite_str():
     c1_str = "col1 = 1"
     c2_str = "col2 > 2"
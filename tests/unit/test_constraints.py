@@ -0,0 +1,309 @@
+import sys
+import weakref
+
+import pytest
+import sqlalchemy as sa
+
+from datajudge.constraints import base, column, date, miscs, numeric
+from datajudge.db_access import (
+    Condition,
+    DataReference,
+    ExpressionDataSource,
+    TableDataSource,
+)
+
+
+def test_logging_message():
+    test_result = base.TestResult.failure(
+        "[numDiff]1[/numDiff] != 2",
+        "NumericMin::table",
+        ["SELECT 1", "SELECT 2"],
+        ["SELECT 3"],
+    )
+    assert test_result.logging_message == (
+        "/*\n\tNumericMin::table\n*/"
+        "\n\n/*\nFailure message:\n1 != 2\n*/"
+        "\n\n --Factual queries: \n SELECT 1\nSELECT 2"
+        "\n\n-- Target queries: \n SELECT 3"
+        "\n --- \n"
+    )
+    assert test_result.logging_message is test_result.logging_message
+
+
+def test_logging_message_success():
+    assert base.TestResult.success().logging_message == "\n --- \n"
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="Slotted dataclasses require Python 3.10."
+)
+def test_test_result_slots():
+    test_result = base.TestResult.failure("failure")
+    assert not hasattr(test_result, "__dict__")
+    with pytest.raises(AttributeError):
+        test_result.outcome = True  # type: ignore[misc]
+
+
+class _CountingConstraint(base.Constraint):
+    def __init__(self, cache_size=None):
+        super().__init__(
+            DataReference(ExpressionDataSource(sa.table("t"), "t")),
+            ref_value=1,
+            cache_size=cache_size,
+        )
+        self.n_retrievals = 0
+
+    def retrieve(self, engine, ref):
+        self.n_retrievals += 1
+        return engine, None
+
+
+@pytest.mark.parametrize(
+    "cache_size, n_retrievals", [(None, 2), (0, 6), (1, 5), (2, 2)]
+)
+def test_factual_value_cache_size(cache_size, n_retrievals):
+    constraint = _CountingConstraint(cache_size)
+    engine1, engine2 = sa.create_engine("sqlite://"), sa.create_engine("sqlite://")
+    for engine in [engine1, engine2, engine1] * 2:
+        assert constraint.get_factual_value(engine) == engine
+    assert constraint.n_retrievals == n_retrievals
+
+
+def test_factual_value_cache_evicts_least_recently_used():
+    constraint = _CountingConstraint(2)
+    engine1, engine2, engine3 = (sa.create_engine("sqlite://") for _ in range(3))
+    for engine in [engine1, engine2, engine1, engine3, engine1]:
+        assert constraint.get_factual_value(engine) == engine
+    assert constraint.n_retrievals == 3
+
+
+class _OverridingConstraint(_CountingConstraint):
+    def get_factual_value(self, engine):
+        self.n_retrievals += 1
+        return engine
+
+    def get_target_value(self, engine):
+        self.n_retrievals += 1
+        return super().get_target_value(engine), engine
+
+
+def test_overridden_factual_value_cached():
+    constraint = _OverridingConstraint()
+    engine1, engine2 = sa.create_engine("sqlite://"), sa.create_engine("sqlite://")
+    for engine in [engine1, engine2, engine1]:
+        assert constraint.get_factual_value(engine) == engine
+    assert constraint.n_retrievals == 2
+
+
+def test_overridden_target_value_calling_super_cached():
+    constraint = _OverridingConstraint()
+    engine = sa.create_engine("sqlite://")
+    for _ in range(2):
+        assert constraint.get_target_value(engine) == (1, engine)
+    assert constraint.n_retrievals == 1
+
+
+def test_cached_constraint_garbage_collected():
+    constraint = _OverridingConstraint()
+    constraint.get_factual_value(sa.create_engine("sqlite://"))
+    reference = weakref.ref(constraint)
+    del constraint
+    assert reference() is None
+
+
+def test_compile_literal():
+    engine = sa.create_engine("sqlite://")
+    selection = sa.select(sa.table("t", sa.column("a"))).where(sa.column("a") > 1)
+    query = base.compile_literal(engine, selection)
+    assert query == "SELECT t.a \nFROM t \nWHERE a > 1"
+    assert base._compiled_queries[selection] == {("sqlite", None): query}
+    assert base.compile_literal(engine, selection) is query
+
+
+def test_queries_compiled_lazily():
+    engine = sa.create_engine("sqlite://")
+    selection = sa.select(sa.table("t", sa.column("a")))
+    test_result = base.TestResult.failure(
+        "failure", _engine=engine, _factual_selections=[selection]
+    )
+    assert selection not in base._compiled_queries
+    assert test_result.factual_queries == ["SELECT t.a \nFROM t"]
+    assert test_result.target_queries is None
+    assert "--Factual queries: \n SELECT t.a \nFROM t" in test_result.logging_message
+
+
+def test_test_result_equality_ignores_engine_and_selections():
+    selection = sa.select(sa.table("t", sa.column("a")))
+    test_results = [
+        base.TestResult.failure(
+            "failure", _engine=sa.create_engine("sqlite://"), _target_selections=[s]
+        )
+        for s in [selection, None]
+    ]
+    assert test_results[0] == test_results[1]
+    assert repr(test_results[0]) == "TestResult(outcome=False)"
+
+
+_DATA_SOURCE = ExpressionDataSource(sa.table("t"), "t")
+_CONDITION1 = Condition(raw_string="a > 1")
+_CONDITION2 = Condition(raw_string="b > 2")
+
+
+@pytest.mark.parametrize(
+    "condition1, condition2, expected",
+    [
+        (None, None, ""),
+        (_CONDITION1, _CONDITION1, "Condition on both tables: WHERE a > 1; "),
+        (None, _CONDITION2, "Condition on second table: WHERE b > 2; "),
+        (_CONDITION1, None, "Condition on first table: WHERE a > 1; "),
+        (
+            _CONDITION1,
+            _CONDITION2,
+            "Condition on first table: WHERE a > 1. "
+            "Condition on second table: WHERE b > 2. ",
+        ),
+    ],
+)
+def test_condition_string_between(condition1, condition2, expected):
+    constraint = base.Constraint(
+        DataReference(_DATA_SOURCE, condition=condition1),
+        ref2=DataReference(_DATA_SOURCE, condition=condition2),
+    )
+    assert constraint.condition_string == expected
+
+
+@pytest.mark.parametrize(
+    "condition, expected", [(None, ""), (_CONDITION1, "Condition: WHERE a > 1")]
+)
+def test_condition_string_within(condition, expected):
+    constraint = base.Constraint(
+        DataReference(_DATA_SOURCE, condition=condition), ref_value=1
+    )
+    assert constraint.condition_string == expected
+
+
+def test_description_cached():
+    constraint = base.Constraint(
+        DataReference(TableDataSource("db", "table1", "schema")),
+        ref2=DataReference(TableDataSource("db", "table2", "schema")),
+    )
+    description = constraint.get_description()
+    assert description == "Constraint::table1 | table2"
+    assert constraint.get_description() is description
+
+
+@pytest.mark.parametrize(
+    "string1, string2, expected",
+    [
+        (
+            "db1.schema.table",
+            "db2.schema.table",
+            ("db1.schema.table", "db2.schema.table"),
+        ),
+        ("db.schema.table1", "db.schema.table2", ("table1", "table2")),
+        (
+            "db.schema1.table",
+            "db.schema2.table",
+            ("schema1.table", "schema2.table"),
+        ),
+        ("db.db.table1", "db.db.table2", ("table1", "table2")),
+        ("table1", "table2", ("table1", "table2")),
+        ("table", "table", ("table", "table")),
+    ],
+)
+def test_uncommon_substrings(string1, string2, expected):
+    assert base.uncommon_substrings(string1, string2) == expected
+
+
+def test_between_or_within():
+    ref = DataReference(_DATA_SOURCE)
+    with pytest.raises(ValueError, match="Both table 2 ref and constant given to"):
+        base.Constraint(ref, ref2=ref, ref_value=1)
+    with pytest.raises(ValueError, match="Neither table 2 ref nor constant given to"):
+        base.Constraint(ref)
+
+
+@pytest.mark.parametrize(
+    "column_type, column_type_factual, expected",
+    [
+        ("VARCHAR", sa.types.VARCHAR(10), True),
+        ("varchar", sa.types.VARCHAR(10), True),
+        ("VARCHAR", sa.types.INTEGER(), False),
+        ("integer", sa.types.DECIMAL(38, 0), True),
+    ],
+)
+def test_column_type_compare_within(column_type, column_type_factual, expected):
+    constraint = column.ColumnType(DataReference(_DATA_SOURCE), column_type=column_type)
+    assert constraint.compare(column_type_factual, column_type)[0] is expected
+
+
+def test_column_type_compare_between():
+    ref = DataReference(_DATA_SOURCE)
+    constraint = column.ColumnType(ref, ref2=ref)
+    assert constraint.compare(sa.types.VARCHAR(10), "VARCHAR")[0]
+    assert constraint.compare(sa.types.DECIMAL(38, 0), "integer")[0]
+    assert not constraint.compare(sa.types.INTEGER(), "VARCHAR")[0]
+
+
+_GAP_KWARGS = {"legitimate_gap_size": 0}
+_OVERLAP_KWARGS = {"end_included": True}
+
+
+@pytest.mark.parametrize(
+    "constraint_class, kwargs, dimensions, violations",
+    [
+        (numeric.NumericNoGap, _GAP_KWARGS, 1, "a gap in the range in start0 and end0"),
+        (
+            numeric.NumericNoOverlap,
+            _OVERLAP_KWARGS,
+            1,
+            "overlapping ranges in start0 and end0",
+        ),
+        (date.DateNoGap, _GAP_KWARGS, 1, "a gap in the date range in start0 and end0"),
+        (
+            date.DateNoOverlap,
+            _OVERLAP_KWARGS,
+            1,
+            "overlapping date ranges in start0 and end0",
+        ),
+        (
+            date.DateNoOverlap2d,
+            _OVERLAP_KWARGS,
+            2,
+            "overlapping date ranges in start0 and end0.and start1 and end1",
+        ),
+    ],
+)
+def test_interval_compare(constraint_class, kwargs, dimensions, violations):
+    constraint = constraint_class(
+        DataReference(_DATA_SOURCE),
+        key_columns=["key"],
+        start_columns=[f"start{i}" for i in range(dimensions)],
+        end_columns=[f"end{i}" for i in range(dimensions)],
+        max_relative_n_violations=0.5,
+        **kwargs,
+    )
+    constraint.sample = None
+    assert constraint.compare((0, 0), None) == (True, None)
+    assert constraint.compare((1, 2), None) == (True, None)
+    result, assertion_text = constraint.compare((2, 3), None)
+    assert not result
+    assert f"with {violations}." in assertion_text
+
+
+@pytest.mark.parametrize(
+    "primary_keys_factual, expected",
+    [
+        ({"a", "b"}, (True, "")),
+        ({"a"}, (False, "t doesn't include b as primary key.")),
+        ({"a", "b", "c"}, (False, "t incorrectly includes c as primary key.")),
+        ({"a", "c"}, (False, "t doesn't include b as primary key.")),
+    ],
+)
+def test_primary_key_definition_compare(primary_keys_factual, expected):
+    constraint = miscs.PrimaryKeyDefinition(DataReference(_DATA_SOURCE), ["a", "b"])
+    assert isinstance(constraint.ref_value, frozenset)
+    assert (
+        constraint.compare(frozenset(primary_keys_factual), frozenset({"a", "b"}))
+        == expected
+    )
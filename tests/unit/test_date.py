@@ -0,0 +1,104 @@
+import datetime as dt
+
+import pytest
+import sqlalchemy as sa
+
+from datajudge.constraints.date import (
+    DateMin,
+    convert_to_date,
+    get_format_from_column_type,
+    parse_input_date,
+)
+from datajudge.db_access import DataReference, ExpressionDataSource
+
+
+@pytest.mark.parametrize(
+    "column_type, expected",
+    [
+        ("date", "%Y-%m-%d"),
+        ("DATE", "%Y-%m-%d"),
+        ("datetime", "%Y-%m-%d %H:%M:%S"),
+        ("DateTime2", "%Y-%m-%d %H:%M:%S"),
+        ("smalldatetime", "%Y-%m-%d %H:%M:%S"),
+    ],
+)
+def test_get_format_from_column_type(column_type, expected):
+    assert get_format_from_column_type(column_type) == expected
+
+
+def test_get_format_from_column_type_illegal():
+    with pytest.raises(ValueError, match="Illegal date column type: time"):
+        get_format_from_column_type("time")
+
+
+@pytest.mark.parametrize(
+    "db_result, format, expected",
+    [
+        ("2021-03-04", "%Y-%m-%d", dt.date(2021, 3, 4)),
+        ("2021-03-04 05:06:07", "%Y-%m-%d %H:%M:%S", dt.date(2021, 3, 4)),
+        ("2021-03-04 05:06:07.123456789", "%Y-%m-%d %H:%M:%S", dt.date(2021, 3, 4)),
+        ("2021-3-4", "%Y-%m-%d", dt.date(2021, 3, 4)),
+        ("2021-03-04 5:06:07", "%Y-%m-%d %H:%M:%S", dt.date(2021, 3, 4)),
+        ("04-03-2021", "%d-%m-%Y", dt.date(2021, 3, 4)),
+        (dt.datetime(2021, 3, 4, 5, 6, 7), "%Y-%m-%d", dt.date(2021, 3, 4)),
+        (dt.date(2021, 3, 4), "%Y-%m-%d", dt.date(2021, 3, 4)),
+    ],
+)
+def test_convert_to_date(db_result, format, expected):
+    assert convert_to_date(db_result, format) == expected
+
+
+@pytest.mark.parametrize(
+    "db_result, format",
+    [("2021-03-04 05:06:07", "%Y-%m-%d"), ("2021-13-04", "%Y-%m-%d")],
+)
+def test_convert_to_date_invalid(db_result, format):
+    with pytest.raises(ValueError):
+        convert_to_date(db_result, format)
+
+
+@pytest.mark.parametrize(
+    "use_lower_bound_reference, min_factual, min_target, expected",
+    [
+        (True, dt.date(2021, 1, 2), dt.date(2021, 1, 1), (True, None)),
+        (True, None, None, (True, None)),
+        (False, dt.date(2021, 1, 1), dt.date(2021, 1, 2), (True, None)),
+        (
+            False,
+            dt.date(2021, 1, 2),
+            dt.date(2021, 1, 1),
+            (False, "t has min 2021-01-02 > "),
+        ),
+    ],
+)
+def test_date_min_compare(use_lower_bound_reference, min_factual, min_target, expected):
+    constraint = DateMin(
+        DataReference(ExpressionDataSource(sa.table("t"), "t")),
+        use_lower_bound_reference,
+        "date",
+        min_value="'2021-01-01'",
+    )
+    result, assertion_text = constraint.compare(min_factual, min_target)
+    assert result == expected[0]
+    if expected[1] is None:
+        assert assertion_text is None
+    else:
+        assert assertion_text is not None
+        assert assertion_text.startswith(expected[1])
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("'2021-03-04'", dt.date(2021, 3, 4)),
+        ("2021-03-04", dt.date(2021, 3, 4)),
+        ("'2021-3-4'", dt.date(2021, 3, 4)),
+    ],
+)
+def test_parse_input_date(value, expected):
+    assert parse_input_date(value) == expected
+
+
+def test_parse_input_date_invalid():
+    with pytest.raises(ValueError, match="does not match format"):
+        parse_input_date("'2021-13-04'")
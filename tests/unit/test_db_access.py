@@ -1,7 +1,16 @@
 import pytest
 import sqlalchemy as sa
 
-from datajudge.db_access import ExpressionDataSource, TableDataSource
+from datajudge.db_access import (
+    DataReference,
+    ExpressionDataSource,
+    RawQueryDataSource,
+    TableDataSource,
+    connect,
+    get_column_type,
+    get_interval_overlaps_nd,
+    shared_connection,
+)
 
 
 @pytest.mark.parametrize(
@@ -26,3 +35,46 @@ def test_table_data_source_string(input, expected):
 def test_expression_data_source_string(expression, name, expected):
     ds = ExpressionDataSource(expression, name)
     assert str(ds) == expected
+
+
+def test_shared_connection():
+    engine = sa.create_engine("sqlite://")
+    other_engine = sa.create_engine("sqlite://")
+    with shared_connection(engine) as connection:
+        with connect(engine) as connection1, connect(engine) as connection2:
+            assert connection1 is connection2 is connection
+        with shared_connection(engine) as nested_connection:
+            assert nested_connection is connection
+        with connect(other_engine) as other_connection:
+            assert other_connection is not connection
+    assert connection.closed
+    with connect(engine) as connection1, connect(engine) as connection2:
+        assert connection1 is not connection2
+
+
+def test_get_column_type():
+    engine = sa.create_engine("sqlite://")
+    table = sa.table("t", sa.column("a", sa.Integer()), sa.column("b", sa.String()))
+    data_source = ExpressionDataSource(table, "t")
+    assert isinstance(
+        get_column_type(engine, DataReference(data_source, columns=["b"]))[0],
+        sa.String,
+    )
+    assert isinstance(
+        get_column_type(engine, DataReference(data_source))[0], sa.Integer
+    )
+
+
+def test_interval_overlaps_ignore_null_starts():
+    # SQLite sorts NULLs first, s.t. a NULL start would precede all other starts.
+    engine = sa.create_engine("sqlite://")
+    rows = (
+        "SELECT 1 AS k, NULL AS s, 100 AS e "
+        "UNION ALL SELECT 1, 1, 2 UNION ALL SELECT 1, 5, 6"
+    )
+    ref = DataReference(RawQueryDataSource(rows, "t", columns=["k", "s", "e"]))
+    _, n_violations_selection = get_interval_overlaps_nd(
+        engine, ref, ["k"], ["s"], ["e"], end_included=True
+    )
+    with engine.connect() as connection:
+        assert connection.execute(n_violations_selection).scalar() == 0
@@ -10,6 +10,8 @@ def test_default_formatter():
     assert formatter.fmt_str("[numMatch]Hello[/numMatch]") == "Hello"
     assert formatter.fmt_str("[b]Hello[/b]") == "[b]Hello[/b]"
     assert formatter.fmt_str("[numDiff]Hello[/numMatch]") == "[numDiff]Hello[/numMatch]"
+    assert formatter.fmt_str("[numDiff]Hello") == "[numDiff]Hello"
+    assert formatter.fmt_str("Hello") == "Hello"
 
 
 def test_ansi_color_formatter():
@@ -0,0 +1,17 @@
+import subprocess
+import sys
+
+import datajudge
+
+
+def test_lazy_imports():
+    code = "import sys, datajudge; print('sqlalchemy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True
+    )
+    assert output.stdout.decode("utf-8").strip() == "False"
+
+
+def test_public_objects():
+    for name in datajudge.__all__:
+        assert getattr(datajudge, name).__name__ == name
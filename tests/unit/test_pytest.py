@@ -15,6 +15,15 @@ def test_collect_data_tests():
     ]
 
 
+def test_collect_data_tests_max_workers():
+    req = WithinRequirement.from_raw_query("select * from example", "example_table")
+    req.add_n_rows_equality_constraint(42)
+    req.add_n_rows_min_constraint(1)
+    test_func = pytest_integration.collect_data_tests([req], max_workers=2)
+    (parametrize_mark,) = test_func.pytestmark
+    assert parametrize_mark.args[1] == list(req)
+
+
 @pytest.mark.parametrize(
     "method_name,arguments",
     [
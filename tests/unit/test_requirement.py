@@ -1,8 +1,15 @@
 import inspect
+from typing import List
 
-from datajudge import WithinRequirement
+import sqlalchemy as sa
+
+from datajudge import WithinRequirement, db_access
+from datajudge.constraints.base import Constraint, TestResult
+from datajudge.db_access import DataReference, ExpressionDataSource
 from datajudge.requirements import BetweenRequirement
 
+_DATA_SOURCE = ExpressionDataSource(sa.table("t"), "t")
+
 
 def test_all_requirements_new_kwargs():
     prices_req = WithinRequirement.from_table(
@@ -29,3 +36,43 @@ def test_all_requirements_new_kwargs():
                 sig.parameters,
                 sig,
             )
+
+
+class _TwoQueryConstraint(Constraint):
+    def __init__(self):
+        super().__init__(DataReference(_DATA_SOURCE), ref_value=1)
+
+    def test(self, engine):
+        with db_access.connect(engine) as connection1:
+            with db_access.connect(engine) as connection2:
+                return TestResult(connection1 is connection2, None)
+
+
+def test_requirement_shares_connection_per_constraint():
+    engine = sa.create_engine("sqlite://")
+    requirement = WithinRequirement.from_raw_query("SELECT 1 AS a", "query")
+    requirement.append(_TwoQueryConstraint())
+    assert all(result.outcome for result in requirement.test(engine))
+
+
+class _ConnectionConstraint(Constraint):
+    def __init__(self, connections):
+        super().__init__(DataReference(_DATA_SOURCE), ref_value=1)
+        self.connections = connections
+
+    def test(self, engine):
+        with db_access.connect(engine) as connection:
+            # The transaction of a previous constraint has been ended.
+            outcome = not connection.in_transaction()
+            connection.execute(sa.text("SELECT 1"))
+            self.connections.append(connection)
+            return TestResult(outcome, None)
+
+
+def test_requirement_shares_connection_across_constraints():
+    engine = sa.create_engine("sqlite://")
+    connections: List[sa.engine.Connection] = []
+    requirement = WithinRequirement.from_raw_query("SELECT 1 AS a", "query")
+    requirement.extend([_ConnectionConstraint(connections) for _ in range(3)])
+    assert all(result.outcome for result in requirement.test(engine))
+    assert connections[0] is connections[1] is connections[2]